@@ -0,0 +1,96 @@
+/*
+ * Exact cosine top-k kernel for the Loki Mode vector index.
+ *
+ * Scores one query against the whole (row-major, float32) matrix and
+ * keeps a running min-heap of the k best rows, so a single call does
+ * the work that otherwise needs a BLAS dispatch plus a full similarity
+ * buffer and an argpartition pass in Python.
+ *
+ * The inner product loop is written so the compiler auto-vectorizes it
+ * to FMA instructions under -O3 -mavx2 -mfma (see vector_index_native.py
+ * for the build line). Returns the number of results written, which is
+ * min(n, k).
+ */
+
+#include <stdint.h>
+
+static void heap_sift_down(float *hs, int32_t *hi, int32_t size, int32_t pos)
+{
+    for (;;) {
+        int32_t left = 2 * pos + 1;
+        int32_t right = left + 1;
+        int32_t smallest = pos;
+
+        if (left < size && hs[left] < hs[smallest])
+            smallest = left;
+        if (right < size && hs[right] < hs[smallest])
+            smallest = right;
+        if (smallest == pos)
+            return;
+
+        float ts = hs[pos];
+        hs[pos] = hs[smallest];
+        hs[smallest] = ts;
+        int32_t ti = hi[pos];
+        hi[pos] = hi[smallest];
+        hi[smallest] = ti;
+        pos = smallest;
+    }
+}
+
+int32_t topk_cosine(const float *mat, const float *q, int32_t n, int32_t d,
+                    int32_t k, int32_t *out_idx, float *out_score)
+{
+    if (k > n)
+        k = n;
+    if (k <= 0)
+        return 0;
+
+    /* out_score/out_idx double as the heap storage */
+    float *hs = out_score;
+    int32_t *hi = out_idx;
+    int32_t size = 0;
+
+    for (int32_t i = 0; i < n; i++) {
+        const float *row = mat + (int64_t)i * d;
+        float acc = 0.0f;
+        for (int32_t j = 0; j < d; j++)
+            acc += row[j] * q[j];
+
+        if (size < k) {
+            /* grow phase: append then sift up */
+            int32_t pos = size++;
+            hs[pos] = acc;
+            hi[pos] = i;
+            while (pos > 0) {
+                int32_t parent = (pos - 1) / 2;
+                if (hs[parent] <= hs[pos])
+                    break;
+                float ts = hs[parent];
+                hs[parent] = hs[pos];
+                hs[pos] = ts;
+                int32_t ti = hi[parent];
+                hi[parent] = hi[pos];
+                hi[pos] = ti;
+                pos = parent;
+            }
+        } else if (acc > hs[0]) {
+            hs[0] = acc;
+            hi[0] = i;
+            heap_sift_down(hs, hi, size, 0);
+        }
+    }
+
+    /* heap-sort in place into descending order */
+    for (int32_t end = size - 1; end > 0; end--) {
+        float ts = hs[0];
+        hs[0] = hs[end];
+        hs[end] = ts;
+        int32_t ti = hi[0];
+        hi[0] = hi[end];
+        hi[end] = ti;
+        heap_sift_down(hs, hi, end, 0);
+    }
+
+    return size;
+}
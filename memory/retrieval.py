@@ -1314,9 +1314,10 @@ class MemoryRetrieval:
                 index_path = self.storage._resolve_path(f"vectors/{name}_index")
             else:
                 index_path = str(self.base_path / "vectors" / f"{name}_index")
-            # Check if the npz file exists (VectorIndex.load expects base path without extension)
+            # Check if the index file exists (VectorIndex.load expects base
+            # path without extension); .npz is the legacy format
             import os
-            if os.path.exists(f"{index_path}.npz"):
+            if os.path.exists(f"{index_path}.npy") or os.path.exists(f"{index_path}.npz"):
                 index.load(index_path)
 
     # -------------------------------------------------------------------------
@@ -9,11 +9,24 @@ memory system's embedding-based search capabilities.
 """
 
 import json
+import logging
 import os
 from typing import Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 
+from . import vector_index_native
+from .vector_index_numba import topk_filtered
+
+# hnswlib is optional - used for approximate search on large indices
+try:
+    import hnswlib
+    HNSWLIB_AVAILABLE = True
+except ImportError:
+    HNSWLIB_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
 
 class VectorIndex:
     """
@@ -22,27 +35,200 @@ class VectorIndex:
     Supports adding, searching, updating, and removing vectors with
     associated metadata. Uses cosine similarity for search ranking.
 
+    Vectors are L2-normalized once at insertion time and stored in a
+    single contiguous float32 matrix, so searches are a plain dot
+    product with no per-search preparation. Original magnitudes are
+    not retained (they are unused for cosine similarity).
+
     Attributes:
         dimension: The dimensionality of vectors in this index.
-        embeddings: List of stored embedding vectors.
         ids: List of unique identifiers for each vector.
         metadata: List of metadata dictionaries for each vector.
     """
 
-    def __init__(self, dimension: int = 384):
+    def __init__(
+        self,
+        dimension: int = 384,
+        quantized: bool = False,
+        ann: str = "auto",
+        ann_threshold: int = 200000,
+        device: str = "cpu"
+    ):
         """
         Initialize a new vector index.
 
         Args:
             dimension: The dimensionality of vectors. Default is 384
                       which matches MiniLM embedding size.
+            quantized: If True, store vectors as int8 with a per-row
+                      scale instead of float32. This quarters memory
+                      and bandwidth for the search hot loop at the
+                      cost of a small quantization error in scores
+                      (typically under 1% for MiniLM embeddings).
+            ann: Approximate-search mode. "auto" routes unfiltered
+                searches through an HNSW graph once the index grows
+                past ann_threshold (requires hnswlib; silently stays
+                exact otherwise). False forces exact search.
+            ann_threshold: Index size at which "auto" switches from
+                exact to approximate search.
+            device: "cuda" offloads batch similarity to the GPU via
+                CuPy, where a single gemm over the whole index is far
+                faster than CPU BLAS at large N. Requires cupy; falls
+                back to "cpu" with a warning when unavailable.
         """
+        if ann not in ("auto", False):
+            raise ValueError(
+                f"ann must be 'auto' or False, got {ann!r}"
+            )
+
         self.dimension = dimension
-        self.embeddings: List[np.ndarray] = []
+        self.quantized = quantized
+        self.ann = ann
+        self.ann_threshold = ann_threshold
+        self._hnsw = None
+        self._hnsw_version = -1
+        self._version = 0
+
+        self.device = "cpu"
+        if device == "cuda":
+            try:
+                import cupy  # noqa: F401
+                self.device = "cuda"
+            except ImportError:
+                logger.warning(
+                    "cupy not installed. Falling back to CPU search. "
+                    "Install with: pip install cupy-cuda12x"
+                )
+        self._gpu_mat = None
+        self._gpu_version = -1
         self.ids: List[str] = []
         self.metadata: List[Dict] = []
-        self._normalized: bool = False
         self._id_to_index: Dict[str, int] = {}
+        self._n: int = 0
+        # Running byte totals so get_stats stays O(1)
+        self._id_bytes: int = 0
+        self._meta_bytes: int = 0
+        # Inverted metadata index: key -> value -> set of vector IDs
+        self._filters: Dict[str, Dict] = {}
+
+        if quantized:
+            self._q_mat: np.ndarray = np.empty((0, dimension), dtype=np.int8)
+            self._scales: np.ndarray = np.empty(0, dtype=np.float32)
+        else:
+            self._norm_mat: np.ndarray = np.empty(
+                (0, dimension), dtype=np.float32
+            )
+
+    @property
+    def embeddings(self) -> np.ndarray:
+        """The stored (normalized) vectors as a (count, dimension) matrix.
+
+        In quantized mode this dequantizes, so prefer the int8 search
+        paths for hot loops.
+        """
+        return self._matrix()
+
+    def _matrix(self) -> np.ndarray:
+        """The stored vectors as a float32 (count, dimension) matrix."""
+        if self.quantized:
+            return (
+                self._q_mat[:self._n].astype(np.float32)
+                * self._scales[:self._n, None]
+            )
+        return self._norm_mat[:self._n]
+
+    def _normalize(self, embedding: np.ndarray) -> np.ndarray:
+        """Return the L2-normalized float32 form of a vector."""
+        # ascontiguousarray is a no-op for contiguous float32 input
+        # (the common case for MiniLM output), unlike astype which
+        # always copies. One reciprocal then a broadcast multiply is
+        # cheaper than dividing every component, and max(norm, eps)
+        # guards zero vectors without shifting nonzero norms
+        vec = np.ascontiguousarray(embedding, dtype=np.float32)
+        inv = np.float32(1.0) / max(np.linalg.norm(vec), 1e-10)
+        return vec * inv
+
+    @staticmethod
+    def _quantize(vec: np.ndarray) -> Tuple[np.ndarray, float]:
+        """Quantize a float32 vector to int8 with a symmetric scale."""
+        scale = float(np.max(np.abs(vec))) / 127.0
+        if scale == 0.0:
+            return np.zeros(vec.shape[0], dtype=np.int8), 0.0
+        return np.round(vec / scale).astype(np.int8), scale
+
+    @staticmethod
+    def _meta_size(metadata: Dict) -> int:
+        """Approximate serialized size of a metadata dict in bytes."""
+        try:
+            return len(json.dumps(metadata))
+        except (TypeError, ValueError):
+            return 0
+
+    def _store_row(self, index: int, vec_norm: np.ndarray) -> None:
+        """Write a normalized vector into the backing storage."""
+        if self.quantized:
+            self._q_mat[index], self._scales[index] = self._quantize(vec_norm)
+        else:
+            self._norm_mat[index] = vec_norm
+
+    def _materialize(self) -> None:
+        """
+        Replace a read-only memory-mapped matrix with an in-memory copy.
+
+        load() keeps the matrix memory-mapped so untouched indices are
+        served from the OS page cache; the first mutation pays for the
+        copy instead.
+        """
+        if not self.quantized and not self._norm_mat.flags.writeable:
+            self._norm_mat = np.array(self._norm_mat, dtype=np.float32)
+
+    def _ensure_capacity(self, extra: int) -> None:
+        """Grow the backing storage so it can hold ``extra`` more rows."""
+        self._materialize()
+        needed = self._n + extra
+        mat = self._q_mat if self.quantized else self._norm_mat
+        capacity = mat.shape[0]
+        if needed <= capacity:
+            return
+
+        new_capacity = max(needed, capacity * 2, 16)
+        if self.quantized:
+            new_mat = np.empty((new_capacity, self.dimension), dtype=np.int8)
+            new_mat[:self._n] = self._q_mat[:self._n]
+            self._q_mat = new_mat
+            new_scales = np.empty(new_capacity, dtype=np.float32)
+            new_scales[:self._n] = self._scales[:self._n]
+            self._scales = new_scales
+        else:
+            new_mat = np.empty(
+                (new_capacity, self.dimension), dtype=np.float32
+            )
+            new_mat[:self._n] = self._norm_mat[:self._n]
+            self._norm_mat = new_mat
+
+    def _use_ann(self) -> bool:
+        """Whether unfiltered searches should go through the HNSW graph."""
+        return (
+            self.ann == "auto"
+            and HNSWLIB_AVAILABLE
+            and not self.quantized
+            and self._n >= self.ann_threshold
+        )
+
+    def _ann_index(self):
+        """Get the HNSW graph, (re)building it if the index changed."""
+        if self._hnsw is not None and self._hnsw_version == self._version:
+            return self._hnsw
+
+        index = hnswlib.Index(space="cosine", dim=self.dimension)
+        index.init_index(max_elements=self._n, M=16, ef_construction=200)
+        index.add_items(
+            np.ascontiguousarray(self._matrix()),
+            np.arange(self._n)
+        )
+        self._hnsw = index
+        self._hnsw_version = self._version
+        return index
 
     def add(
         self,
@@ -75,12 +261,17 @@ class VectorIndex:
             self.update(id, embedding=embedding, metadata=metadata)
             return
 
-        # Add new entry
-        self.embeddings.append(embedding.astype(np.float32))
+        # Add new entry, normalized once at write time
+        self._ensure_capacity(1)
+        self._store_row(self._n, self._normalize(embedding))
         self.ids.append(id)
         self.metadata.append(metadata or {})
-        self._id_to_index[id] = len(self.ids) - 1
-        self._normalized = False
+        self._id_to_index[id] = self._n
+        self._n += 1
+        self._version += 1
+        self._id_bytes += len(id)
+        self._meta_bytes += self._meta_size(metadata or {})
+        self._index_metadata(id, metadata or {})
 
     def add_batch(
         self,
@@ -121,16 +312,88 @@ class VectorIndex:
                 f"number of IDs ({len(ids)})"
             )
 
-        # Add each vector
-        for i, (vec_id, embedding) in enumerate(zip(ids, embeddings)):
-            meta = metadata[i] if metadata else None
-            self.add(vec_id, embedding, meta)
+        # Split the batch: first occurrences of new IDs go in as one
+        # block; duplicates (already present, or repeated within the
+        # batch) are applied through add() afterwards so its
+        # last-write-wins update semantics are preserved
+        fresh: List[int] = []
+        duplicates: List[int] = []
+        seen_in_batch = set()
+        for i, vec_id in enumerate(ids):
+            if vec_id in self._id_to_index or vec_id in seen_in_batch:
+                duplicates.append(i)
+            else:
+                seen_in_batch.add(vec_id)
+                fresh.append(i)
+
+        if not fresh:
+            for i in duplicates:
+                self.add(ids[i], embeddings[i], metadata[i] if metadata else None)
+            return
+
+        block = np.ascontiguousarray(embeddings[fresh], dtype=np.float32)
+        norms = np.linalg.norm(block, axis=1, keepdims=True)
+        block *= 1.0 / np.maximum(norms, 1e-10)
+
+        k = len(fresh)
+        self._ensure_capacity(k)
+        n = self._n
+        if self.quantized:
+            scales = np.max(np.abs(block), axis=1) / 127.0
+            safe = np.maximum(scales, np.finfo(np.float32).tiny)
+            self._q_mat[n:n + k] = np.round(
+                block / safe[:, None]
+            ).astype(np.int8)
+            self._q_mat[n:n + k][scales == 0.0] = 0
+            self._scales[n:n + k] = scales
+        else:
+            self._norm_mat[n:n + k] = block
+
+        # Bookkeeping stays a Python loop, but over cheap scalar work
+        for offset, i in enumerate(fresh):
+            vec_id = ids[i]
+            meta = (metadata[i] if metadata else None) or {}
+            self.ids.append(vec_id)
+            self.metadata.append(meta)
+            self._id_to_index[vec_id] = n + offset
+            self._id_bytes += len(vec_id)
+            self._meta_bytes += self._meta_size(meta)
+            self._index_metadata(vec_id, meta)
+
+        self._n = n + k
+        self._version += 1
+
+        for i in duplicates:
+            self.add(ids[i], embeddings[i], metadata[i] if metadata else None)
+
+    def add_filter_key(self, key: str) -> None:
+        """
+        Register a metadata key for indexed filtering.
+
+        Builds an inverted index mapping each observed value of the key
+        to the set of vector IDs carrying it, maintained incrementally
+        on add/update/remove. Searches passing ``filter={key: value}``
+        then score only the matching rows instead of calling a Python
+        filter function for every row.
+
+        Args:
+            key: The metadata key to index.
+        """
+        if key in self._filters:
+            return
+
+        postings: Dict = {}
+        for vec_id, meta in zip(self.ids, self.metadata):
+            if key in meta:
+                postings.setdefault(meta[key], set()).add(vec_id)
+        self._filters[key] = postings
 
     def search(
         self,
         query: np.ndarray,
         top_k: int = 5,
-        filter_fn: Optional[Callable[[Dict], bool]] = None
+        filter_fn: Optional[Callable[[Dict], bool]] = None,
+        filter: Optional[Dict] = None
     ) -> List[Tuple[str, float, Dict]]:
         """
         Find the top-k most similar vectors to the query.
@@ -142,6 +405,11 @@ class VectorIndex:
             top_k: Maximum number of results to return.
             filter_fn: Optional function to filter results by metadata.
                       Should return True for entries to include.
+            filter: Optional {key: value} metadata equality filter served
+                   from the inverted index (see add_filter_key). Keys not
+                   yet registered are indexed on first use. Much faster
+                   than filter_fn for selective filters since only
+                   matching rows are scored.
 
         Returns:
             List of (id, score, metadata) tuples, sorted by descending score.
@@ -150,7 +418,7 @@ class VectorIndex:
             ValueError: If query dimension does not match index dimension.
         """
         # Handle empty index
-        if len(self.embeddings) == 0:
+        if self._n == 0:
             return []
 
         # Validate dimension
@@ -160,18 +428,78 @@ class VectorIndex:
                 f"index dimension {self.dimension}"
             )
 
-        # Ensure vectors are normalized for cosine similarity
-        if not self._normalized:
-            self._normalize_vectors()
+        # Normalize query (stored vectors are already normalized)
+        query_norm = self._normalize(query)
+
+        # Approximate path for large unfiltered searches
+        if filter_fn is None and not filter and self._use_ann():
+            hnsw = self._ann_index()
+            k = min(top_k, self._n)
+            hnsw.set_ef(max(64, 2 * k))
+            labels, distances = hnsw.knn_query(query_norm[None, :], k=k)
+            return [
+                (self.ids[i], float(1.0 - dist), self.metadata[i])
+                for i, dist in zip(labels[0], distances[0])
+            ]
+
+        # Opt-in native kernel: fused dot products + top-k selection
+        # with no BLAS dispatch or intermediate similarity buffer
+        if (
+            filter_fn is None
+            and not filter
+            and not self.quantized
+            and vector_index_native.enabled()
+        ):
+            native = vector_index_native.topk_cosine(
+                np.ascontiguousarray(self._norm_mat[:self._n]),
+                query_norm,
+                top_k
+            )
+            if native is not None:
+                indices, scores = native
+                return [
+                    (self.ids[i], float(score), self.metadata[i])
+                    for i, score in zip(indices, scores)
+                ]
+
+        # Indexed filter path: score only the posting-list rows
+        if filter:
+            candidate_ids = None
+            for key, value in filter.items():
+                self.add_filter_key(key)
+                posting = self._filters[key].get(value, set())
+                candidate_ids = (
+                    set(posting) if candidate_ids is None
+                    else candidate_ids & posting
+                )
+                if not candidate_ids:
+                    return []
 
-        # Normalize query
-        query_norm = query / (np.linalg.norm(query) + 1e-10)
+            indices = np.fromiter(
+                (self._id_to_index[vec_id] for vec_id in candidate_ids),
+                dtype=np.int64,
+                count=len(candidate_ids)
+            )
+            scores = self._matrix()[indices] @ query_norm
 
-        # Stack normalized embeddings into matrix for efficient computation
-        embeddings_matrix = np.vstack(self._normalized_embeddings)
+            results = [
+                (self.ids[i], float(score), self.metadata[i])
+                for i, score in zip(indices, scores)
+                if filter_fn is None or filter_fn(self.metadata[i])
+            ]
+            results.sort(key=lambda x: x[1], reverse=True)
+            return results[:top_k]
 
         # Compute cosine similarities
-        similarities = np.dot(embeddings_matrix, query_norm)
+        if self.quantized:
+            # Integer dot products rescaled by the per-row and query scales
+            q_query, q_scale = self._quantize(query_norm)
+            similarities = (
+                self._q_mat[:self._n].astype(np.int32)
+                @ q_query.astype(np.int32)
+            ).astype(np.float32) * self._scales[:self._n] * q_scale
+        else:
+            similarities = np.dot(self._norm_mat[:self._n], query_norm)
 
         # Build results with optional filtering
         results = []
@@ -188,6 +516,159 @@ class VectorIndex:
         results.sort(key=lambda x: x[1], reverse=True)
         return results[:top_k]
 
+    def search_batch(
+        self,
+        queries: np.ndarray,
+        top_k: int = 5
+    ) -> List[List[Tuple[str, float, Dict]]]:
+        """
+        Find the top-k most similar vectors for a batch of queries.
+
+        All queries are scored in a single matrix-matrix product, which
+        is substantially faster than calling search() per query because
+        the index matrix is reused across the whole batch.
+
+        Args:
+            queries: 2D numpy array of shape (n_queries, dimension).
+            top_k: Maximum number of results per query.
+
+        Returns:
+            One result list per query, each a list of (id, score,
+            metadata) tuples sorted by descending score.
+
+        Raises:
+            ValueError: If queries shape does not match index dimension.
+        """
+        if len(queries.shape) != 2:
+            raise ValueError("Queries must be a 2D array")
+
+        if queries.shape[1] != self.dimension:
+            raise ValueError(
+                f"Query dimension {queries.shape[1]} does not match "
+                f"index dimension {self.dimension}"
+            )
+
+        # Handle empty index
+        if self._n == 0:
+            return [[] for _ in range(queries.shape[0])]
+
+        # Normalize queries rowwise (reciprocal then broadcast multiply)
+        queries = np.ascontiguousarray(queries, dtype=np.float32)
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries_norm = queries * (1.0 / np.maximum(norms, 1e-10))
+
+        # GPU path: one cuBLAS gemm plus device-side top-k selection,
+        # copying only k results per query back to the host
+        if self.device == "cuda" and not self.quantized:
+            import cupy as cp
+
+            if self._gpu_mat is None or self._gpu_version != self._version:
+                self._gpu_mat = cp.asarray(self._norm_mat[:self._n])
+                self._gpu_version = self._version
+
+            sims_gpu = cp.asarray(queries_norm) @ self._gpu_mat.T
+            k = min(top_k, self._n)
+            top_gpu = cp.argpartition(-sims_gpu, k - 1, axis=1)[:, :k]
+            scores_gpu = cp.take_along_axis(sims_gpu, top_gpu, axis=1)
+            order_gpu = cp.argsort(-scores_gpu, axis=1)
+            top_indices = cp.take_along_axis(top_gpu, order_gpu, axis=1).get()
+            top_scores = cp.take_along_axis(scores_gpu, order_gpu, axis=1).get()
+            return [
+                [
+                    (self.ids[idx], float(score), self.metadata[idx])
+                    for idx, score in zip(row_indices, row_scores)
+                ]
+                for row_indices, row_scores in zip(top_indices, top_scores)
+            ]
+
+        # One gemm for the whole batch: (n_queries, n) similarity matrix
+        if self.quantized:
+            q_queries = np.empty_like(queries_norm, dtype=np.int8)
+            q_scales = np.empty(queries_norm.shape[0], dtype=np.float32)
+            for i in range(queries_norm.shape[0]):
+                q_queries[i], q_scales[i] = self._quantize(queries_norm[i])
+            similarities = (
+                q_queries.astype(np.int32)
+                @ self._q_mat[:self._n].astype(np.int32).T
+            ).astype(np.float32) * q_scales[:, None] * self._scales[None, :self._n]
+        else:
+            similarities = queries_norm @ self._norm_mat[:self._n].T
+
+        k = min(top_k, self._n)
+
+        # Select top-k per row in O(n), then sort just those k
+        top_indices = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(similarities, top_indices, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        top_indices = np.take_along_axis(top_indices, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        return [
+            [
+                (self.ids[idx], float(score), self.metadata[idx])
+                for idx, score in zip(row_indices, row_scores)
+            ]
+            for row_indices, row_scores in zip(top_indices, top_scores)
+        ]
+
+    def search_mask(
+        self,
+        query: np.ndarray,
+        mask: np.ndarray,
+        top_k: int = 5
+    ) -> List[Tuple[str, float, Dict]]:
+        """
+        Find the top-k most similar vectors among rows selected by a mask.
+
+        This is the fast path for filtered search: callers precompute a
+        boolean mask (e.g. from metadata tags) and the similarity,
+        mask check, and top-k selection are fused into a single pass
+        instead of scoring every row and filtering in Python.
+
+        Args:
+            query: The query vector to search for.
+            mask: Boolean array with one entry per stored vector.
+                  True entries are candidates for the search.
+            top_k: Maximum number of results to return.
+
+        Returns:
+            List of (id, score, metadata) tuples, sorted by descending score.
+
+        Raises:
+            ValueError: If query dimension does not match index dimension.
+            ValueError: If mask length does not match the number of vectors.
+        """
+        # Handle empty index
+        if self._n == 0:
+            return []
+
+        # Validate dimensions
+        if query.shape[0] != self.dimension:
+            raise ValueError(
+                f"Query dimension {query.shape[0]} does not match "
+                f"index dimension {self.dimension}"
+            )
+
+        if mask.shape[0] != self._n:
+            raise ValueError(
+                f"Mask length {mask.shape[0]} does not match "
+                f"index size {self._n}"
+            )
+
+        query_norm = self._normalize(query)
+
+        indices, scores = topk_filtered(
+            np.ascontiguousarray(self._matrix()),
+            np.ascontiguousarray(query_norm),
+            np.ascontiguousarray(mask, dtype=np.bool_),
+            top_k
+        )
+
+        return [
+            (self.ids[i], float(score), self.metadata[i])
+            for i, score in zip(indices, scores)
+        ]
+
     def remove(self, id: str) -> bool:
         """
         Remove a vector from the index by ID.
@@ -202,15 +683,32 @@ class VectorIndex:
             return False
 
         index = self._id_to_index[id]
-
-        # Remove from lists
-        del self.embeddings[index]
-        del self.ids[index]
-        del self.metadata[index]
-
-        # Rebuild index mapping
-        self._rebuild_id_index()
-        self._normalized = False
+        victim_meta = self.metadata[index]
+        self._materialize()
+
+        # Swap the victim with the last entry and shrink by one, so
+        # removal is O(1) instead of shifting every later row and
+        # rescanning all IDs to rebuild the mapping
+        last = self._n - 1
+        if index != last:
+            if self.quantized:
+                self._q_mat[index] = self._q_mat[last]
+                self._scales[index] = self._scales[last]
+            else:
+                self._norm_mat[index] = self._norm_mat[last]
+            moved_id = self.ids[last]
+            self.ids[index] = moved_id
+            self.metadata[index] = self.metadata[last]
+            self._id_to_index[moved_id] = index
+
+        self.ids.pop()
+        self.metadata.pop()
+        del self._id_to_index[id]
+        self._n = last
+        self._version += 1
+        self._id_bytes -= len(id)
+        self._meta_bytes -= self._meta_size(victim_meta)
+        self._unindex_metadata(id, victim_meta)
 
         return True
 
@@ -245,11 +743,17 @@ class VectorIndex:
                     f"Embedding dimension {embedding.shape[0]} does not match "
                     f"index dimension {self.dimension}"
                 )
-            self.embeddings[index] = embedding.astype(np.float32)
-            self._normalized = False
+            self._materialize()
+            self._store_row(index, self._normalize(embedding))
+            self._version += 1
 
         if metadata is not None:
+            self._unindex_metadata(id, self.metadata[index])
+            self._meta_bytes += (
+                self._meta_size(metadata) - self._meta_size(self.metadata[index])
+            )
             self.metadata[index] = metadata
+            self._index_metadata(id, metadata)
 
         return True
 
@@ -257,7 +761,9 @@ class VectorIndex:
         """
         Save the index to disk.
 
-        Creates a .npz file for embeddings and a .json sidecar for metadata.
+        Creates a .npy file for embeddings and a .json sidecar for
+        metadata. The plain .npy format allows load() to memory-map
+        the matrix instead of reading it eagerly.
 
         Args:
             path: Base path for the save files (without extension).
@@ -265,17 +771,17 @@ class VectorIndex:
         # Ensure directory exists
         os.makedirs(os.path.dirname(path) if os.path.dirname(path) else ".", exist_ok=True)
 
-        # Save embeddings
-        if len(self.embeddings) > 0:
-            embeddings_matrix = np.vstack(self.embeddings)
-        else:
-            embeddings_matrix = np.array([]).reshape(0, self.dimension)
-
-        np.savez(
-            f"{path}.npz",
-            embeddings=embeddings_matrix,
-            dimension=np.array([self.dimension])
-        )
+        # Save embeddings (already normalized; dequantized if needed so
+        # the on-disk format is independent of the storage mode).
+        # Write to a temp file and rename into place: np.save would
+        # otherwise truncate the very file a memory-mapped matrix is
+        # still reading from, zeroing the data mid-write. The rename
+        # gives the new data its own inode while any live mmap keeps
+        # the old pages
+        tmp_path = f"{path}.npy.tmp"
+        np.save(tmp_path, self._matrix())
+        # np.save appends .npy when the target lacks the extension
+        os.replace(f"{tmp_path}.npy", f"{path}.npy")
 
         # Save metadata as JSON sidecar
         sidecar_data = {
@@ -291,42 +797,71 @@ class VectorIndex:
         """
         Load the index from disk.
 
+        Indices saved in the current .npy format are memory-mapped, so
+        loading is O(1) and untouched rows are paged in on demand; the
+        first mutation converts to an in-memory copy. Legacy .npz
+        indices are still read (eagerly, with re-normalization).
+
         Args:
             path: Base path for the save files (without extension).
 
         Raises:
             FileNotFoundError: If the index files do not exist.
         """
+        npy_path = f"{path}.npy"
         npz_path = f"{path}.npz"
         json_path = f"{path}.json"
 
-        if not os.path.exists(npz_path):
-            raise FileNotFoundError(f"Index file not found: {npz_path}")
+        if not os.path.exists(npy_path) and not os.path.exists(npz_path):
+            raise FileNotFoundError(f"Index file not found: {npy_path}")
 
         if not os.path.exists(json_path):
             raise FileNotFoundError(f"Metadata file not found: {json_path}")
 
-        # Load embeddings
-        data = np.load(npz_path)
-        embeddings_matrix = data["embeddings"]
-        self.dimension = int(data["dimension"][0])
-
         # Load metadata
         with open(json_path, "r") as f:
             sidecar_data = json.load(f)
 
         self.ids = sidecar_data["ids"]
         self.metadata = sidecar_data["metadata"]
+        self.dimension = int(sidecar_data["dimension"])
 
-        # Convert embeddings matrix to list
-        if embeddings_matrix.shape[0] > 0:
-            self.embeddings = [embeddings_matrix[i] for i in range(embeddings_matrix.shape[0])]
+        if os.path.exists(npy_path):
+            # Current format: saved normalized, serve as a read-only
+            # memmap until the first mutation
+            matrix = np.load(npy_path, mmap_mode="r")
         else:
-            self.embeddings = []
+            # Legacy .npz format: eager read, re-normalize since these
+            # may predate normalization moving to write time
+            data = np.load(npz_path)
+            self.dimension = int(data["dimension"][0])
+            matrix = np.ascontiguousarray(
+                data["embeddings"], dtype=np.float32
+            )
+            if matrix.shape[0] > 0:
+                norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+                matrix = matrix / (norms + 1e-10)
+
+        self._n = matrix.shape[0]
+        if self.quantized:
+            self._q_mat = np.empty((self._n, self.dimension), dtype=np.int8)
+            self._scales = np.empty(self._n, dtype=np.float32)
+            for i in range(self._n):
+                self._q_mat[i], self._scales[i] = self._quantize(
+                    np.asarray(matrix[i], dtype=np.float32)
+                )
+        else:
+            self._norm_mat = matrix
 
-        # Rebuild index
+        # Rebuild index, size counters, and registered filter postings
+        self._version += 1
         self._rebuild_id_index()
-        self._normalized = False
+        self._id_bytes = sum(len(id_) for id_ in self.ids)
+        self._meta_bytes = sum(self._meta_size(m) for m in self.metadata)
+        registered = list(self._filters)
+        self._filters = {}
+        for key in registered:
+            self.add_filter_key(key)
 
     @classmethod
     def from_file(cls, path: str) -> "VectorIndex":
@@ -343,22 +878,6 @@ class VectorIndex:
         index.load(path)
         return index
 
-    def _normalize_vectors(self) -> None:
-        """
-        Normalize copies of all vectors for cosine similarity search.
-
-        This is called automatically before search operations.
-        Uses explicit copies to avoid corrupting the original stored embeddings.
-        """
-        self._normalized_embeddings = []
-        for embedding in self.embeddings:
-            vec_copy = embedding.copy()
-            norm = np.linalg.norm(vec_copy)
-            if norm > 0:
-                vec_copy = vec_copy / norm
-            self._normalized_embeddings.append(vec_copy)
-        self._normalized = True
-
     def _cosine_similarity(self, a: np.ndarray, b: np.ndarray) -> float:
         """
         Compute cosine similarity between two vectors.
@@ -378,13 +897,27 @@ class VectorIndex:
 
         return float(np.dot(a, b) / (norm_a * norm_b))
 
+    def _index_metadata(self, id: str, metadata: Dict) -> None:
+        """Add an entry's registered metadata keys to the inverted index."""
+        for key, postings in self._filters.items():
+            if key in metadata:
+                postings.setdefault(metadata[key], set()).add(id)
+
+    def _unindex_metadata(self, id: str, metadata: Dict) -> None:
+        """Drop an entry's registered metadata keys from the inverted index."""
+        for key, postings in self._filters.items():
+            if key in metadata:
+                id_set = postings.get(metadata[key])
+                if id_set is not None:
+                    id_set.discard(id)
+
     def _rebuild_id_index(self) -> None:
         """Rebuild the ID to index mapping after modifications."""
         self._id_to_index = {id_: i for i, id_ in enumerate(self.ids)}
 
     def __len__(self) -> int:
         """Return the number of vectors in the index."""
-        return len(self.embeddings)
+        return self._n
 
     def __contains__(self, id: str) -> bool:
         """Check if an ID exists in the index."""
@@ -416,11 +949,19 @@ class VectorIndex:
 
     def clear(self) -> None:
         """Remove all vectors from the index."""
-        self.embeddings = []
         self.ids = []
         self.metadata = []
         self._id_to_index = {}
-        self._normalized = False
+        self._n = 0
+        self._version += 1
+        self._id_bytes = 0
+        self._meta_bytes = 0
+        self._filters = {key: {} for key in self._filters}
+        if self.quantized:
+            self._q_mat = np.empty((0, self.dimension), dtype=np.int8)
+            self._scales = np.empty(0, dtype=np.float32)
+        else:
+            self._norm_mat = np.empty((0, self.dimension), dtype=np.float32)
 
     def get_stats(self) -> Dict:
         """
@@ -432,19 +973,19 @@ class VectorIndex:
                 - dimension: Vector dimensionality
                 - memory_bytes: Estimated memory usage in bytes
         """
-        count = len(self.embeddings)
+        count = self._n
 
         # Estimate memory usage
-        # Each float32 is 4 bytes
-        embedding_bytes = count * self.dimension * 4
-
-        # Rough estimate for IDs and metadata (varies with content)
-        id_bytes = sum(len(id_) for id_ in self.ids)
-        metadata_bytes = sum(
-            len(json.dumps(m)) for m in self.metadata
-        ) if self.metadata else 0
+        # Each float32 is 4 bytes; quantized rows are 1 byte per
+        # component plus a float32 scale
+        if self.quantized:
+            embedding_bytes = count * self.dimension + count * 4
+        else:
+            embedding_bytes = count * self.dimension * 4
 
-        total_bytes = embedding_bytes + id_bytes + metadata_bytes
+        # Rough estimate for IDs and metadata, maintained incrementally
+        # on add/update/remove so this call does not traverse the index
+        total_bytes = embedding_bytes + self._id_bytes + self._meta_bytes
 
         return {
             "count": count,
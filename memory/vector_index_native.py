@@ -0,0 +1,112 @@
+"""
+Loki Mode Vector Index - Native Kernel Loader
+
+Optional ctypes binding for the C top-k kernel in _native/dot.c.
+
+For single-query exact search the BLAS dispatch overhead (parameter
+marshaling, temporary similarity buffer, argpartition pass) dominates
+at MiniLM-sized dimensions. The native kernel fuses the dot products
+and top-k selection into one pass with no intermediate allocations.
+
+The kernel is opt-in: it is built on first use with the system C
+compiler only when LOKI_VECTOR_NATIVE=1 is set, and every failure
+(no compiler, build error, load error) falls back silently to the
+numpy path. No build system or binary artifact is required.
+"""
+
+import ctypes
+import logging
+import os
+import subprocess
+from typing import Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_NATIVE_DIR = os.path.join(os.path.dirname(__file__), "_native")
+_SRC_PATH = os.path.join(_NATIVE_DIR, "dot.c")
+_LIB_PATH = os.path.join(_NATIVE_DIR, "_dot.so")
+
+_lib: Optional[ctypes.CDLL] = None
+_load_attempted = False
+
+
+def enabled() -> bool:
+    """Whether the native kernel is opted in via LOKI_VECTOR_NATIVE=1."""
+    return os.environ.get("LOKI_VECTOR_NATIVE") == "1"
+
+
+def _load() -> Optional[ctypes.CDLL]:
+    """Build (if needed) and load the kernel; None when unavailable."""
+    global _lib, _load_attempted
+    if _lib is not None or _load_attempted:
+        return _lib
+    _load_attempted = True
+
+    try:
+        if not os.path.exists(_LIB_PATH) or (
+            os.path.getmtime(_LIB_PATH) < os.path.getmtime(_SRC_PATH)
+        ):
+            subprocess.run(
+                [
+                    "cc", "-O3", "-mavx2", "-mfma", "-ffast-math",
+                    "-shared", "-fPIC", "-o", _LIB_PATH, _SRC_PATH,
+                ],
+                check=True,
+                capture_output=True,
+            )
+
+        lib = ctypes.CDLL(_LIB_PATH)
+        lib.topk_cosine.restype = ctypes.c_int32
+        lib.topk_cosine.argtypes = [
+            ctypes.POINTER(ctypes.c_float),
+            ctypes.POINTER(ctypes.c_float),
+            ctypes.c_int32,
+            ctypes.c_int32,
+            ctypes.c_int32,
+            ctypes.POINTER(ctypes.c_int32),
+            ctypes.POINTER(ctypes.c_float),
+        ]
+        _lib = lib
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug("Native top-k kernel unavailable: %s", e)
+    return _lib
+
+
+def topk_cosine(
+    mat: np.ndarray,
+    query: np.ndarray,
+    top_k: int
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Score one query against the matrix and return the top-k rows.
+
+    Args:
+        mat: C-contiguous float32 matrix of normalized vectors.
+        query: C-contiguous float32 normalized query vector.
+        top_k: Maximum number of results.
+
+    Returns:
+        (indices, scores) sorted by descending score, or None when the
+        native kernel is not available (caller falls back to numpy).
+    """
+    lib = _load()
+    if lib is None:
+        return None
+
+    n = mat.shape[0]
+    k = min(top_k, n)
+    out_idx = np.empty(max(k, 1), dtype=np.int32)
+    out_score = np.empty(max(k, 1), dtype=np.float32)
+
+    count = lib.topk_cosine(
+        mat.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
+        query.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
+        np.int32(n),
+        np.int32(mat.shape[1]),
+        np.int32(k),
+        out_idx.ctypes.data_as(ctypes.POINTER(ctypes.c_int32)),
+        out_score.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
+    )
+    return out_idx[:count], out_score[:count]
@@ -0,0 +1,44 @@
+"""JSON encode/decode helpers for the Autonomi SDK.
+
+Prefers orjson, then msgspec, then the standard library, keeping the
+SDK dependency-free by default while large list endpoints get a C
+parser for free when either accelerator is installed.
+
+All implementations share the same contract: ``dumps`` returns UTF-8
+bytes and ``loads`` accepts str or bytes.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to UTF-8 JSON bytes."""
+        return orjson.dumps(obj)
+
+    loads = orjson.loads
+
+except ImportError:
+    try:
+        import msgspec.json
+
+        _encoder = msgspec.json.Encoder()
+        _decoder = msgspec.json.Decoder()
+
+        def dumps(obj: Any) -> bytes:
+            """Serialize an object to UTF-8 JSON bytes."""
+            return _encoder.encode(obj)
+
+        loads = _decoder.decode
+
+    except ImportError:
+        import json
+
+        def dumps(obj: Any) -> bytes:
+            """Serialize an object to UTF-8 JSON bytes."""
+            return json.dumps(obj).encode("utf-8")
+
+        loads = json.loads
@@ -12,10 +12,13 @@ class TokenAuth:
         if not token:
             raise ValueError("Token must not be empty")
         self._token = token
+        # Built once; the token never changes, so rebuilding the dict
+        # and formatting the header on every request is wasted work
+        self._headers = {"Authorization": f"Bearer {token}"}
 
     def __repr__(self) -> str:
         return "TokenAuth(token='loki_****')"
 
     def headers(self) -> Dict[str, str]:
-        """Return authorization headers."""
-        return {"Authorization": f"Bearer {self._token}"}
+        """Return authorization headers (cached; treat as read-only)."""
+        return self._headers
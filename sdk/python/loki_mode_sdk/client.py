@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import json
-import urllib.error
+import http.client
 import urllib.parse
-import urllib.request
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from . import _json
 from .auth import TokenAuth
 from .types import ApiKey, AuditEntry, Project, Run, RunEvent, Tenant
 
@@ -51,6 +50,25 @@ _STATUS_ERROR_MAP = {
 }
 
 
+def _fast_qs(params: Dict[str, Any]) -> str:
+    """Encode a query string for the common all-scalar case.
+
+    The SDK's query parameters are simple strings and ints, for which
+    a direct join is cheaper than urlencode's generic type dispatch.
+    Anything else falls back to urlencode.
+    """
+    quote = urllib.parse.quote_plus
+    parts = []
+    for key, value in params.items():
+        if isinstance(value, str):
+            parts.append(f"{key}={quote(value)}")
+        elif isinstance(value, (int, float)):
+            parts.append(f"{key}={value}")
+        else:
+            return urllib.parse.urlencode(params)
+    return "&".join(parts)
+
+
 class AutonomiClient:
     """Synchronous client for the Autonomi Control Plane API.
 
@@ -75,8 +93,41 @@ class AutonomiClient:
         self.timeout = timeout
         self._auth: Optional[TokenAuth] = TokenAuth(token) if token else None
 
+        parsed = urllib.parse.urlsplit(self.base_url)
+        self._scheme = parsed.scheme or "http"
+        self._netloc = parsed.netloc
+        self._base_path = parsed.path.rstrip("/")
+        self._connections: Dict[Tuple[str, str], http.client.HTTPConnection] = {}
+
     # -- internal helpers ----------------------------------------------------
 
+    def _get_connection(
+        self, scheme: str, netloc: str
+    ) -> http.client.HTTPConnection:
+        """Get or lazily create a persistent connection for an origin.
+
+        Connections are kept alive and reused across requests, so
+        polling callers pay the TCP (and TLS) handshake once instead
+        of once per call.
+        """
+        key = (scheme, netloc)
+        conn = self._connections.get(key)
+        if conn is None:
+            conn_cls = (
+                http.client.HTTPSConnection
+                if scheme == "https"
+                else http.client.HTTPConnection
+            )
+            conn = conn_cls(netloc, timeout=self.timeout)
+            self._connections[key] = conn
+        return conn
+
+    def close(self) -> None:
+        """Close any persistent connections held by the client."""
+        for conn in self._connections.values():
+            conn.close()
+        self._connections.clear()
+
     def _request(
         self,
         method: str,
@@ -85,54 +136,71 @@ class AutonomiClient:
         params: Optional[Dict[str, Any]] = None,
     ) -> Optional[Dict[str, Any]]:
         """Execute an HTTP request and return parsed JSON (or None for 204)."""
-        url = f"{self.base_url}{path}"
+        url_path = f"{self._base_path}{path}"
 
         if params:
             filtered = {k: v for k, v in params.items() if v is not None}
             if filtered:
-                url = f"{url}?{urllib.parse.urlencode(filtered)}"
+                url_path = f"{url_path}?{_fast_qs(filtered)}"
 
         body_bytes: Optional[bytes] = None
         if data is not None:
-            body_bytes = json.dumps(data).encode("utf-8")
+            body_bytes = _json.dumps(data)
 
-        req = urllib.request.Request(url, data=body_bytes, method=method)
-        req.add_header("Content-Type", "application/json")
-        req.add_header("Accept", "application/json")
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "Connection": "keep-alive",
+        }
 
         if self._auth:
-            for key, value in self._auth.headers().items():
-                req.add_header(key, value)
+            headers.update(self._auth.headers())
 
+        conn = self._get_connection(self._scheme, self._netloc)
         try:
-            with urllib.request.urlopen(req, timeout=self.timeout) as resp:
-                if resp.status == 204:
-                    return None
-                raw = resp.read().decode("utf-8")
-                if not raw:
-                    return None
-                return json.loads(raw)
-        except urllib.error.HTTPError as exc:
+            conn.request(method, url_path, body=body_bytes, headers=headers)
+            resp = conn.getresponse()
+        except (http.client.BadStatusLine, ConnectionError):
+            # The server closed a kept-alive connection between requests;
+            # reconnect once and retry
+            conn.close()
+            self._connections.pop((self._scheme, self._netloc), None)
+            conn = self._get_connection(self._scheme, self._netloc)
+            conn.request(method, url_path, body=body_bytes, headers=headers)
+            resp = conn.getresponse()
+
+        # Always drain the response so the connection can be reused
+        raw = resp.read()
+
+        if resp.status >= 400:
             response_body = ""
             try:
-                response_body = exc.read().decode("utf-8")
+                response_body = raw.decode("utf-8")
             except Exception:
                 pass
 
-            error_cls = _STATUS_ERROR_MAP.get(exc.code, AutonomiError)
-            message = f"HTTP {exc.code}: {exc.reason}"
+            error_cls = _STATUS_ERROR_MAP.get(resp.status, AutonomiError)
+            message = f"HTTP {resp.status}: {resp.reason}"
 
             # Try to extract a message from the JSON body
             try:
-                err_data = json.loads(response_body)
+                err_data = _json.loads(raw)
                 if "detail" in err_data:
-                    message = f"HTTP {exc.code}: {err_data['detail']}"
+                    message = f"HTTP {resp.status}: {err_data['detail']}"
                 elif "message" in err_data:
-                    message = f"HTTP {exc.code}: {err_data['message']}"
-            except (json.JSONDecodeError, KeyError):
+                    message = f"HTTP {resp.status}: {err_data['message']}"
+            except (ValueError, KeyError):
                 pass
 
-            raise error_cls(message, status_code=exc.code, response_body=response_body)
+            raise error_cls(
+                message, status_code=resp.status, response_body=response_body
+            )
+
+        if resp.status == 204 or not raw:
+            return None
+        # Parse bytes directly; avoids materializing an intermediate str
+        # of the full payload before parsing
+        return _json.loads(raw)
 
     def _get(
         self, path: str, params: Optional[Dict[str, Any]] = None
@@ -167,7 +235,7 @@ class AutonomiClient:
         if not result:
             return []
         items = result if isinstance(result, list) else result.get("projects", [])
-        return [Project.from_dict(p) for p in items]
+        return Project.from_dicts(items)
 
     def get_project(self, project_id: str) -> Project:
         """Get a single project by ID."""
@@ -192,7 +260,7 @@ class AutonomiClient:
         if not result:
             return []
         items = result if isinstance(result, list) else result.get("tenants", [])
-        return [Tenant.from_dict(t) for t in items]
+        return Tenant.from_dicts(items)
 
     def create_tenant(
         self, name: str, description: Optional[str] = None
@@ -221,7 +289,7 @@ class AutonomiClient:
         if not result:
             return []
         items = result if isinstance(result, list) else result.get("runs", [])
-        return [Run.from_dict(r) for r in items]
+        return Run.from_dicts(items)
 
     def get_run(self, run_id: str) -> Run:
         """Get a single run by ID."""
@@ -244,7 +312,7 @@ class AutonomiClient:
         if not result:
             return []
         items = result if isinstance(result, list) else result.get("events", [])
-        return [RunEvent.from_dict(e) for e in items]
+        return RunEvent.from_dicts(items)
 
     # -- API keys ------------------------------------------------------------
 
@@ -254,7 +322,7 @@ class AutonomiClient:
         if not result:
             return []
         items = result if isinstance(result, list) else result.get("keys", [])
-        return [ApiKey.from_dict(k) for k in items]
+        return ApiKey.from_dicts(items)
 
     def create_api_key(
         self, name: str, role: str = "viewer"
@@ -294,4 +362,4 @@ class AutonomiClient:
         if not result:
             return []
         items = result if isinstance(result, list) else result.get("entries", [])
-        return [AuditEntry.from_dict(e) for e in items]
+        return AuditEntry.from_dicts(items)
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+import http.client
+import json
+import time
+import urllib.parse
+from typing import Any, Dict, Iterator, List, Optional, TYPE_CHECKING
 
 from .types import RunEvent
 
@@ -31,4 +35,96 @@ class EventStream:
         if not result:
             return []
         items = result if isinstance(result, list) else result.get("events", [])
-        return [RunEvent.from_dict(e) for e in items]
+        return RunEvent.from_dicts(items)
+
+    def stream_events(
+        self,
+        run_id: str,
+        since: Optional[str] = None,
+        poll_interval: float = 1.0,
+    ) -> Iterator[RunEvent]:
+        """Stream run events over Server-Sent Events.
+
+        Issues a single long-lived request instead of one request per
+        poll, so events arrive with round-trip latency rather than
+        poll-interval latency. Falls back to polling when the server
+        does not support the streaming endpoint (404/501); in that
+        case poll_interval controls the polling cadence.
+
+        The iterator ends when the server closes the stream.
+        """
+        client = self._client
+        url_path = f"{client._base_path}/api/runs/{run_id}/events/stream"
+        if since is not None:
+            url_path = f"{url_path}?{urllib.parse.urlencode({'since': since})}"
+
+        headers = {
+            "Accept": "text/event-stream",
+            "Connection": "keep-alive",
+        }
+        if client._auth:
+            headers.update(client._auth.headers())
+
+        # A dedicated connection: the stream holds it open indefinitely,
+        # so the client's pooled connection stays free for other calls
+        conn_cls = (
+            http.client.HTTPSConnection
+            if client._scheme == "https"
+            else http.client.HTTPConnection
+        )
+        conn = conn_cls(client._netloc, timeout=client.timeout)
+        try:
+            conn.request("GET", url_path, headers=headers)
+            resp = conn.getresponse()
+
+            if resp.status in (404, 501):
+                conn.close()
+                yield from self._poll_fallback(run_id, since, poll_interval)
+                return
+
+            if resp.status >= 400:
+                from .client import AutonomiError, _STATUS_ERROR_MAP
+
+                error_cls = _STATUS_ERROR_MAP.get(resp.status, AutonomiError)
+                raise error_cls(
+                    f"HTTP {resp.status}: {resp.reason}",
+                    status_code=resp.status,
+                )
+
+            # Parse SSE frames: "data: {...}" lines terminated by a
+            # blank line; other SSE fields (event:, id:) are ignored
+            data_lines: List[bytes] = []
+            while True:
+                line = resp.readline()
+                if not line:
+                    break
+                line = line.strip()
+                if not line:
+                    if data_lines:
+                        payload = b"\n".join(data_lines)
+                        data_lines = []
+                        try:
+                            event = json.loads(payload)
+                        except ValueError:
+                            continue
+                        yield RunEvent.from_dict(event)
+                    continue
+                if line.startswith(b"data:"):
+                    data_lines.append(line[5:].strip())
+        finally:
+            conn.close()
+
+    def _poll_fallback(
+        self,
+        run_id: str,
+        since: Optional[str],
+        poll_interval: float,
+    ) -> Iterator[RunEvent]:
+        """Polling loop used when the server has no streaming endpoint."""
+        while True:
+            events = self.poll_events(run_id, since=since)
+            for event in events:
+                if event.timestamp:
+                    since = event.timestamp
+                yield event
+            time.sleep(poll_interval)
@@ -31,7 +31,7 @@ class TaskManager:
         if not result:
             return []
         items = result if isinstance(result, list) else result.get("tasks", [])
-        return [Task.from_dict(t) for t in items]
+        return Task.from_dicts(items)
 
     def get_task(self, task_id: str) -> Task:
         """Get a single task by ID."""
@@ -5,11 +5,10 @@ All HTTP calls are mocked via unittest.mock -- no real server needed.
 
 from __future__ import annotations
 
-import io
 import json
 import unittest
+from functools import lru_cache
 from unittest.mock import MagicMock, patch
-from urllib.error import HTTPError
 
 import sys
 import os
@@ -39,29 +38,57 @@ from loki_mode_sdk.tasks import TaskManager
 from loki_mode_sdk.events import EventStream
 
 
-def _mock_response(data, status=200):
-    """Create a mock urllib response."""
-    body = json.dumps(data).encode("utf-8") if data is not None else b""
-    resp = MagicMock()
-    resp.status = status
-    resp.read.return_value = body
-    resp.__enter__ = MagicMock(return_value=resp)
-    resp.__exit__ = MagicMock(return_value=False)
-    return resp
+class _FakeResponse:
+    """Lightweight stand-in for http.client.HTTPResponse.
+
+    A concrete class is much cheaper to build and call than a MagicMock
+    with configured attributes, which dominates this suite's runtime.
+    """
+
+    __slots__ = ("status", "reason", "_body")
+
+    def __init__(self, body, status=200, reason="OK"):
+        self.status = status
+        self.reason = reason
+        self._body = body
+
+    def read(self):
+        return self._body
+
+
+@lru_cache(maxsize=128)
+def _encode(data_json):
+    """Cache encoded bodies; many tests reuse identical payloads."""
+    return data_json.encode("utf-8")
+
+
+def _mock_response(data, status=200, reason="OK"):
+    """Create a fake http.client response."""
+    body = _encode(json.dumps(data, sort_keys=True)) if data is not None else b""
+    return _FakeResponse(body, status, reason)
+
+
+@lru_cache(maxsize=32)
+def _error_body(reason):
+    """Cache the standard error payloads reused across error tests."""
+    return json.dumps({"detail": reason}).encode("utf-8")
 
 
 def _mock_http_error(code, reason="Error", body=None):
-    """Create a mock HTTPError."""
+    """Create a fake http.client error response."""
     if body is None:
-        body = json.dumps({"detail": reason})
-    fp = io.BytesIO(body.encode("utf-8") if isinstance(body, str) else body)
-    return HTTPError(
-        url="http://localhost:57374/api/test",
-        code=code,
-        msg=reason,
-        hdrs={},
-        fp=fp,
-    )
+        encoded = _error_body(reason)
+    elif isinstance(body, str):
+        encoded = body.encode("utf-8")
+    else:
+        encoded = body
+    return _FakeResponse(encoded, code, reason)
+
+
+def _request_call(mock_conn_cls):
+    """Return (method, path, body, headers) of the last issued request."""
+    args, kwargs = mock_conn_cls.return_value.request.call_args
+    return args[0], args[1], kwargs.get("body"), kwargs.get("headers") or {}
 
 
 class TestTokenAuth(unittest.TestCase):
@@ -104,102 +131,105 @@ class TestClientInit(unittest.TestCase):
 
 
 class TestRequestMethod(unittest.TestCase):
-    def setUp(self):
-        self.client = AutonomiClient(
+    @classmethod
+    def setUpClass(cls):
+        cls.client = AutonomiClient(
             base_url="http://localhost:57374", token="loki_test"
         )
 
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_get_request(self, mock_urlopen):
-        mock_urlopen.return_value = _mock_response({"status": "ok"})
+    def setUp(self):
+        # Drop pooled connections so each test binds to its own
+        # patched HTTPConnection class
+        self.client.close()
+
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_get_request(self, mock_conn_cls):
+        mock_conn_cls.return_value.getresponse.return_value = _mock_response({"status": "ok"})
         result = self.client._get("/api/status")
         self.assertEqual(result, {"status": "ok"})
-        call_args = mock_urlopen.call_args
-        req = call_args[0][0]
-        self.assertEqual(req.get_method(), "GET")
+        method, path, _, _ = _request_call(mock_conn_cls)
+        self.assertEqual(method, "GET")
 
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_post_request_with_data(self, mock_urlopen):
-        mock_urlopen.return_value = _mock_response({"id": "proj-1"})
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_post_request_with_data(self, mock_conn_cls):
+        mock_conn_cls.return_value.getresponse.return_value = _mock_response({"id": "proj-1"})
         result = self.client._post("/api/projects", data={"name": "test"})
         self.assertEqual(result, {"id": "proj-1"})
-        call_args = mock_urlopen.call_args
-        req = call_args[0][0]
-        self.assertEqual(req.get_method(), "POST")
-        self.assertEqual(json.loads(req.data), {"name": "test"})
-
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_put_request(self, mock_urlopen):
-        mock_urlopen.return_value = _mock_response({"updated": True})
+        method, path, body, _ = _request_call(mock_conn_cls)
+        self.assertEqual(method, "POST")
+        self.assertEqual(json.loads(body), {"name": "test"})
+
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_put_request(self, mock_conn_cls):
+        mock_conn_cls.return_value.getresponse.return_value = _mock_response({"updated": True})
         result = self.client._put("/api/tasks/1", data={"status": "done"})
         self.assertEqual(result, {"updated": True})
-        call_args = mock_urlopen.call_args
-        req = call_args[0][0]
-        self.assertEqual(req.get_method(), "PUT")
+        method, _, _, _ = _request_call(mock_conn_cls)
+        self.assertEqual(method, "PUT")
 
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_delete_request(self, mock_urlopen):
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_delete_request(self, mock_conn_cls):
         resp = _mock_response(None, status=204)
-        resp.read.return_value = b""
-        mock_urlopen.return_value = resp
+        mock_conn_cls.return_value.getresponse.return_value = resp
         self.client._delete("/api/projects/1")
-        call_args = mock_urlopen.call_args
-        req = call_args[0][0]
-        self.assertEqual(req.get_method(), "DELETE")
+        method, _, _, _ = _request_call(mock_conn_cls)
+        self.assertEqual(method, "DELETE")
 
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_auth_headers_included(self, mock_urlopen):
-        mock_urlopen.return_value = _mock_response({"ok": True})
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_auth_headers_included(self, mock_conn_cls):
+        mock_conn_cls.return_value.getresponse.return_value = _mock_response({"ok": True})
         self.client._get("/api/status")
-        call_args = mock_urlopen.call_args
-        req = call_args[0][0]
-        self.assertEqual(req.get_header("Authorization"), "Bearer loki_test")
+        _, _, _, headers = _request_call(mock_conn_cls)
+        self.assertEqual(headers["Authorization"], "Bearer loki_test")
 
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_query_params(self, mock_urlopen):
-        mock_urlopen.return_value = _mock_response([])
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_query_params(self, mock_conn_cls):
+        mock_conn_cls.return_value.getresponse.return_value = _mock_response([])
         self.client._get("/api/runs", params={"status": "running"})
-        call_args = mock_urlopen.call_args
-        req = call_args[0][0]
-        self.assertIn("status=running", req.full_url)
+        _, path, _, _ = _request_call(mock_conn_cls)
+        self.assertIn("status=running", path)
 
 
 class TestErrorHandling(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.client = AutonomiClient(token="loki_test")
+
     def setUp(self):
-        self.client = AutonomiClient(token="loki_test")
+        self.client.close()
 
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_401_raises_authentication_error(self, mock_urlopen):
-        mock_urlopen.side_effect = _mock_http_error(401, "Unauthorized")
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_401_raises_authentication_error(self, mock_conn_cls):
+        mock_conn_cls.return_value.getresponse.return_value = _mock_http_error(401, "Unauthorized")
         with self.assertRaises(AuthenticationError) as ctx:
             self.client.get_status()
         self.assertEqual(ctx.exception.status_code, 401)
 
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_403_raises_forbidden_error(self, mock_urlopen):
-        mock_urlopen.side_effect = _mock_http_error(403, "Forbidden")
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_403_raises_forbidden_error(self, mock_conn_cls):
+        mock_conn_cls.return_value.getresponse.return_value = _mock_http_error(403, "Forbidden")
         with self.assertRaises(ForbiddenError) as ctx:
             self.client.get_status()
         self.assertEqual(ctx.exception.status_code, 403)
 
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_404_raises_not_found_error(self, mock_urlopen):
-        mock_urlopen.side_effect = _mock_http_error(404, "Not Found")
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_404_raises_not_found_error(self, mock_conn_cls):
+        mock_conn_cls.return_value.getresponse.return_value = _mock_http_error(404, "Not Found")
         with self.assertRaises(NotFoundError) as ctx:
             self.client.get_project("nonexistent")
         self.assertEqual(ctx.exception.status_code, 404)
 
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_500_raises_autonomi_error(self, mock_urlopen):
-        mock_urlopen.side_effect = _mock_http_error(500, "Internal Server Error")
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_500_raises_autonomi_error(self, mock_conn_cls):
+        mock_conn_cls.return_value.getresponse.return_value = _mock_http_error(500, "Internal Server Error")
         with self.assertRaises(AutonomiError) as ctx:
             self.client.get_status()
         self.assertEqual(ctx.exception.status_code, 500)
 
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_error_includes_response_body(self, mock_urlopen):
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_error_includes_response_body(self, mock_conn_cls):
         body = json.dumps({"detail": "Rate limit exceeded"})
-        mock_urlopen.side_effect = _mock_http_error(429, "Too Many Requests", body)
+        mock_conn_cls.return_value.getresponse.return_value = _mock_http_error(429, "Too Many Requests", body)
         with self.assertRaises(AutonomiError) as ctx:
             self.client.get_status()
         self.assertIn("Rate limit exceeded", str(ctx.exception))
@@ -207,12 +237,16 @@ class TestErrorHandling(unittest.TestCase):
 
 
 class TestListProjects(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.client = AutonomiClient(token="loki_test")
+
     def setUp(self):
-        self.client = AutonomiClient(token="loki_test")
+        self.client.close()
 
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_list_projects_returns_project_objects(self, mock_urlopen):
-        mock_urlopen.return_value = _mock_response(
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_list_projects_returns_project_objects(self, mock_conn_cls):
+        mock_conn_cls.return_value.getresponse.return_value = _mock_response(
             {
                 "projects": [
                     {"id": "p1", "name": "Alpha", "status": "active"},
@@ -227,9 +261,9 @@ class TestListProjects(unittest.TestCase):
         self.assertEqual(projects[0].name, "Alpha")
         self.assertEqual(projects[1].status, "archived")
 
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_list_projects_handles_array_response(self, mock_urlopen):
-        mock_urlopen.return_value = _mock_response(
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_list_projects_handles_array_response(self, mock_conn_cls):
+        mock_conn_cls.return_value.getresponse.return_value = _mock_response(
             [{"id": "p1", "name": "Solo"}]
         )
         projects = self.client.list_projects()
@@ -238,12 +272,16 @@ class TestListProjects(unittest.TestCase):
 
 
 class TestCreateProject(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.client = AutonomiClient(token="loki_test")
+
     def setUp(self):
-        self.client = AutonomiClient(token="loki_test")
+        self.client.close()
 
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_create_project(self, mock_urlopen):
-        mock_urlopen.return_value = _mock_response(
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_create_project(self, mock_conn_cls):
+        mock_conn_cls.return_value.getresponse.return_value = _mock_response(
             {"id": "p-new", "name": "New Project", "description": "Test desc"}
         )
         project = self.client.create_project("New Project", description="Test desc")
@@ -251,20 +289,23 @@ class TestCreateProject(unittest.TestCase):
         self.assertEqual(project.id, "p-new")
         self.assertEqual(project.description, "Test desc")
 
-        call_args = mock_urlopen.call_args
-        req = call_args[0][0]
-        body = json.loads(req.data)
+        _, _, raw_body, _ = _request_call(mock_conn_cls)
+        body = json.loads(raw_body)
         self.assertEqual(body["name"], "New Project")
         self.assertEqual(body["description"], "Test desc")
 
 
 class TestListRuns(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.client = AutonomiClient(token="loki_test")
+
     def setUp(self):
-        self.client = AutonomiClient(token="loki_test")
+        self.client.close()
 
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_list_runs_returns_run_objects(self, mock_urlopen):
-        mock_urlopen.return_value = _mock_response(
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_list_runs_returns_run_objects(self, mock_conn_cls):
+        mock_conn_cls.return_value.getresponse.return_value = _mock_response(
             {
                 "runs": [
                     {
@@ -288,40 +329,46 @@ class TestListRuns(unittest.TestCase):
         self.assertEqual(runs[0].status, "running")
         self.assertEqual(runs[1].trigger, "schedule")
 
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_list_runs_with_status_filter(self, mock_urlopen):
-        mock_urlopen.return_value = _mock_response({"runs": []})
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_list_runs_with_status_filter(self, mock_conn_cls):
+        mock_conn_cls.return_value.getresponse.return_value = _mock_response({"runs": []})
         self.client.list_runs(status="failed")
-        call_args = mock_urlopen.call_args
-        req = call_args[0][0]
-        self.assertIn("status=failed", req.full_url)
+        _, path, _, _ = _request_call(mock_conn_cls)
+        self.assertIn("status=failed", path)
 
 
 class TestCancelRun(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.client = AutonomiClient(token="loki_test")
+
     def setUp(self):
-        self.client = AutonomiClient(token="loki_test")
+        self.client.close()
 
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_cancel_run(self, mock_urlopen):
-        mock_urlopen.return_value = _mock_response(
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_cancel_run(self, mock_conn_cls):
+        mock_conn_cls.return_value.getresponse.return_value = _mock_response(
             {"id": "r1", "project_id": "p1", "status": "cancelled"}
         )
         run = self.client.cancel_run("r1")
         self.assertIsInstance(run, Run)
         self.assertEqual(run.status, "cancelled")
-        call_args = mock_urlopen.call_args
-        req = call_args[0][0]
-        self.assertTrue(req.full_url.endswith("/api/v2/runs/r1/cancel"))
-        self.assertEqual(req.get_method(), "POST")
+        method, path, _, _ = _request_call(mock_conn_cls)
+        self.assertTrue(path.endswith("/api/v2/runs/r1/cancel"))
+        self.assertEqual(method, "POST")
 
 
 class TestQueryAudit(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.client = AutonomiClient(token="loki_test")
+
     def setUp(self):
-        self.client = AutonomiClient(token="loki_test")
+        self.client.close()
 
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_query_audit_returns_entries(self, mock_urlopen):
-        mock_urlopen.return_value = _mock_response(
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_query_audit_returns_entries(self, mock_conn_cls):
+        mock_conn_cls.return_value.getresponse.return_value = _mock_response(
             {
                 "entries": [
                     {
@@ -341,17 +388,16 @@ class TestQueryAudit(unittest.TestCase):
         self.assertEqual(entries[0].action, "project.create")
         self.assertTrue(entries[0].success)
 
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_query_audit_params(self, mock_urlopen):
-        mock_urlopen.return_value = _mock_response({"entries": []})
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_query_audit_params(self, mock_conn_cls):
+        mock_conn_cls.return_value.getresponse.return_value = _mock_response({"entries": []})
         self.client.query_audit(
             start_date="2026-01-01", end_date="2026-02-01", limit=10
         )
-        call_args = mock_urlopen.call_args
-        req = call_args[0][0]
-        self.assertIn("start_date=2026-01-01", req.full_url)
-        self.assertIn("end_date=2026-02-01", req.full_url)
-        self.assertIn("limit=10", req.full_url)
+        _, path, _, _ = _request_call(mock_conn_cls)
+        self.assertIn("start_date=2026-01-01", path)
+        self.assertIn("end_date=2026-02-01", path)
+        self.assertIn("limit=10", path)
 
 
 class TestDataclasses(unittest.TestCase):
@@ -409,6 +455,20 @@ class TestDataclasses(unittest.TestCase):
         self.assertEqual(k.role, "admin")
         self.assertEqual(k.scopes, ["read", "write"])
 
+    def test_from_dicts_matches_from_dict(self):
+        items = [
+            {"id": "r1", "project_id": "p1", "config": {"parallelism": 4}},
+            {"id": "r2", "status": "failed"},
+        ]
+        batch = Run.from_dicts(items)
+        singles = [Run.from_dict(d) for d in items]
+        self.assertEqual(batch, singles)
+        # absent container fields share a read-only empty singleton
+        empty = Run.from_dicts([{"id": "a"}, {"id": "b"}])
+        self.assertIs(empty[0].config, empty[1].config)
+        with self.assertRaises(TypeError):
+            empty[0].config["x"] = 1
+
     def test_audit_entry_from_dict(self):
         a = AuditEntry.from_dict(
             {
@@ -423,22 +483,26 @@ class TestDataclasses(unittest.TestCase):
 
 
 class TestTaskManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.client = AutonomiClient(token="loki_test")
+        cls.tasks = TaskManager(cls.client)
+
     def setUp(self):
-        self.client = AutonomiClient(token="loki_test")
-        self.tasks = TaskManager(self.client)
+        self.client.close()
 
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_create_task(self, mock_urlopen):
-        mock_urlopen.return_value = _mock_response(
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_create_task(self, mock_conn_cls):
+        mock_conn_cls.return_value.getresponse.return_value = _mock_response(
             {"id": "t1", "project_id": "p1", "title": "Build UI", "priority": "high"}
         )
         task = self.tasks.create_task("p1", "Build UI", priority="high")
         self.assertIsInstance(task, Task)
         self.assertEqual(task.title, "Build UI")
 
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_update_task(self, mock_urlopen):
-        mock_urlopen.return_value = _mock_response(
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_update_task(self, mock_conn_cls):
+        mock_conn_cls.return_value.getresponse.return_value = _mock_response(
             {"id": "t1", "project_id": "p1", "title": "Build UI", "status": "done"}
         )
         task = self.tasks.update_task("t1", status="done")
@@ -446,13 +510,17 @@ class TestTaskManager(unittest.TestCase):
 
 
 class TestSessionManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.client = AutonomiClient(token="loki_test")
+        cls.sessions = SessionManager(cls.client)
+
     def setUp(self):
-        self.client = AutonomiClient(token="loki_test")
-        self.sessions = SessionManager(self.client)
+        self.client.close()
 
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_list_sessions(self, mock_urlopen):
-        mock_urlopen.return_value = _mock_response(
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_list_sessions(self, mock_conn_cls):
+        mock_conn_cls.return_value.getresponse.return_value = _mock_response(
             {"sessions": [{"id": "s1", "status": "active"}]}
         )
         sessions = self.sessions.list_sessions("p1")
@@ -461,13 +529,17 @@ class TestSessionManager(unittest.TestCase):
 
 
 class TestEventStream(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.client = AutonomiClient(token="loki_test")
+        cls.events = EventStream(cls.client)
+
     def setUp(self):
-        self.client = AutonomiClient(token="loki_test")
-        self.events = EventStream(self.client)
+        self.client.close()
 
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_poll_events(self, mock_urlopen):
-        mock_urlopen.return_value = _mock_response(
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_poll_events(self, mock_conn_cls):
+        mock_conn_cls.return_value.getresponse.return_value = _mock_response(
             {
                 "events": [
                     {
@@ -484,29 +556,64 @@ class TestEventStream(unittest.TestCase):
         self.assertIsInstance(events[0], RunEvent)
         self.assertEqual(events[0].event_type, "task_complete")
 
+    @patch("loki_mode_sdk.events.http.client.HTTPConnection")
+    def test_stream_events_parses_sse_frames(self, mock_conn_cls):
+        resp = MagicMock()
+        resp.status = 200
+        resp.readline.side_effect = [
+            b"event: run_event\n",
+            b'data: {"id": "e1", "run_id": "r1", "event_type": "phase_start"}\n',
+            b"\n",
+            b'data: {"id": "e2", "run_id": "r1", "event_type": "phase_end"}\n',
+            b"\n",
+            b"",
+        ]
+        mock_conn_cls.return_value.getresponse.return_value = resp
+        events = list(self.events.stream_events("r1"))
+        self.assertEqual([e.id for e in events], ["e1", "e2"])
+        self.assertEqual(events[0].event_type, "phase_start")
+
+    @patch("loki_mode_sdk.events.http.client.HTTPConnection")
+    def test_stream_events_falls_back_to_polling_on_404(self, mock_conn_cls):
+        # First connection serves the 404 for the stream endpoint; the
+        # second is the client's pooled connection used by poll_events
+        stream_conn = MagicMock()
+        stream_conn.getresponse.return_value = _mock_http_error(404, "Not Found")
+        poll_conn = MagicMock()
+        poll_conn.getresponse.return_value = _mock_response(
+            {"events": [{"id": "e1", "run_id": "r1", "event_type": "task_complete"}]}
+        )
+        mock_conn_cls.side_effect = [stream_conn, poll_conn]
+        stream = self.events.stream_events("r1")
+        self.assertEqual(next(stream).id, "e1")
+        stream.close()
+
 
 class TestApiKeys(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.client = AutonomiClient(token="loki_test")
+
     def setUp(self):
-        self.client = AutonomiClient(token="loki_test")
+        self.client.close()
 
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_create_api_key(self, mock_urlopen):
-        mock_urlopen.return_value = _mock_response(
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_create_api_key(self, mock_conn_cls):
+        mock_conn_cls.return_value.getresponse.return_value = _mock_response(
             {"id": "k1", "name": "ci", "token": "loki_secret", "role": "admin"}
         )
         result = self.client.create_api_key("ci", role="admin")
         self.assertEqual(result["token"], "loki_secret")
 
-    @patch("loki_mode_sdk.client.urllib.request.urlopen")
-    def test_rotate_api_key(self, mock_urlopen):
-        mock_urlopen.return_value = _mock_response(
+    @patch("loki_mode_sdk.client.http.client.HTTPConnection")
+    def test_rotate_api_key(self, mock_conn_cls):
+        mock_conn_cls.return_value.getresponse.return_value = _mock_response(
             {"id": "k1", "new_token": "loki_rotated", "grace_until": "2026-02-22"}
         )
         result = self.client.rotate_api_key("k1", grace_period_hours=48)
         self.assertEqual(result["new_token"], "loki_rotated")
-        call_args = mock_urlopen.call_args
-        req = call_args[0][0]
-        body = json.loads(req.data)
+        _, _, raw_body, _ = _request_call(mock_conn_cls)
+        body = json.loads(raw_body)
         self.assertEqual(body["grace_period_hours"], 48)
 
 
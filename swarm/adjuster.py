@@ -6,6 +6,7 @@ agent additions, removals, or replacements based on performance data.
 
 from __future__ import annotations
 
+import sys
 from typing import Any, Dict, List, Optional
 
 
@@ -41,13 +42,168 @@ GATE_TO_AGENT: Dict[str, str] = {
     "documentation": "prod-techwriter",
 }
 
+# Intern the agent-type values so membership checks against interned
+# agent types below reduce to pointer compares
+GATE_TO_AGENT = {k: sys.intern(v) for k, v in GATE_TO_AGENT.items()}
+
+
+def evaluate_adjustment(
+    current_agents: List[Dict[str, Any]],
+    quality_signals: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Evaluate whether the swarm needs adjustment.
+
+    Module-level function so the per-iteration hot path pays no
+    instance dispatch; SwarmAdjuster below remains as a thin wrapper
+    for existing callers.
+
+    Args:
+        current_agents: List of agent dicts with at least 'type' and
+            'priority' keys.
+        quality_signals: Dict with quality metrics:
+            gate_pass_rate: float (0-1) -- fraction of quality gates passing
+            test_coverage: float (0-1) -- code test coverage
+            review_pass_rate: float (0-1) -- fraction of reviews passing
+            iteration_count: int -- current RARV iteration
+            failed_gates: list[str] -- names of failing quality gates
+
+    Returns:
+        Dict with keys:
+            action: "none" | "add" | "remove" | "replace"
+            agents_to_add: list of {type, reason} dicts
+            agents_to_remove: list of {type, reason} dicts
+            rationale: human-readable explanation
+    """
+    signal = quality_signals.get
+    gate_pass_rate = signal("gate_pass_rate", 1.0)
+    test_coverage = signal("test_coverage", 1.0)
+    review_pass_rate = signal("review_pass_rate", 1.0)
+    iteration_count = signal("iteration_count", 0)
+    failed_gates = signal("failed_gates", [])
+
+    # Fast path: a healthy swarm needs no rule evaluation at all.
+    # These bounds make every rule below provably a no-op (Rule 1
+    # needs gate < 0.5, Rule 2 coverage < 0.6, Rule 3 review < 0.5,
+    # Rule 4 more than four agents), so skip straight to the answer
+    if (
+        gate_pass_rate >= 0.8
+        and test_coverage >= 0.6
+        and review_pass_rate >= 0.5
+        and not failed_gates
+        and len(current_agents) <= 4
+    ):
+        # Fresh empty lists: results are caller-owned and mutable, so a
+        # shared singleton here could be poisoned by one append
+        return {
+            "action": "none",
+            "agents_to_add": [],
+            "agents_to_remove": [],
+            "rationale": "All quality signals within acceptable range",
+        }
+
+    # Membership set for the rules below, built with a bound .add and
+    # skipping empty/missing types so no sentinel value is admitted
+    current_types: set = set()
+    add_type = current_types.add
+    for agent in current_agents:
+        agent_type = agent.get("type")
+        if agent_type:
+            add_type(sys.intern(agent_type))
+    agents_to_add: List[Dict[str, str]] = []
+    agents_to_remove: List[Dict[str, str]] = []
+    reasons: List[str] = []
+
+    # Rule 1: Failing quality gates after several iterations
+    if gate_pass_rate < 0.5 and iteration_count > 3:
+        for gate_name in failed_gates:
+            # Gate names are machine-generated lowercase in practice;
+            # skip the .lower() allocation on that fast path while
+            # staying case-insensitive for hand-written inputs
+            normalized = (
+                gate_name if gate_name.islower() else gate_name.lower()
+            )
+            agent_type = GATE_TO_AGENT.get(normalized)
+            if agent_type and agent_type not in current_types:
+                agents_to_add.append({
+                    "type": agent_type,
+                    "reason": f"Gate '{gate_name}' failing consistently",
+                })
+                current_types.add(agent_type)
+        if agents_to_add:
+            reasons.append(
+                f"Gate pass rate ({gate_pass_rate:.0%}) below 50% "
+                f"after {iteration_count} iterations"
+            )
+
+    # Rule 2: Low test coverage
+    if test_coverage < 0.6 and "eng-qa" not in current_types:
+        agents_to_add.append({
+            "type": "eng-qa",
+            "reason": f"Test coverage at {test_coverage:.0%}, below 60% threshold",
+        })
+        current_types.add("eng-qa")
+        reasons.append(f"Test coverage ({test_coverage:.0%}) critically low")
+
+    # Rule 3: Low review pass rate
+    if review_pass_rate < 0.5 and "review-security" not in current_types:
+        agents_to_add.append({
+            "type": "review-security",
+            "reason": f"Review pass rate at {review_pass_rate:.0%}, adding security review",
+        })
+        current_types.add("review-security")
+        reasons.append(f"Review pass rate ({review_pass_rate:.0%}) below 50%")
+
+    # Rule 4: Everything healthy -- consider trimming
+    if (
+        gate_pass_rate > 0.8
+        and test_coverage > 0.8
+        and review_pass_rate > 0.8
+        and len(current_agents) > 4
+        and not agents_to_add
+    ):
+        # Find the agent with the highest priority number (least
+        # critical, priority >= 3) in a single pass - no intermediate
+        # list and no per-element key lambda
+        best_priority = 2
+        to_remove = None
+        for agent in current_agents:
+            priority = agent.get("priority", 1)
+            if priority > best_priority:
+                best_priority = priority
+                to_remove = agent
+        if to_remove is not None:
+            agents_to_remove.append({
+                "type": to_remove.get("type", "unknown"),
+                "reason": "All quality signals healthy; reducing team size",
+            })
+            reasons.append(
+                "All signals above 80%; trimming optional agent"
+            )
+
+    # Determine action
+    if agents_to_add and agents_to_remove:
+        action = "replace"
+    elif agents_to_add:
+        action = "add"
+    elif agents_to_remove:
+        action = "remove"
+    else:
+        action = "none"
+        reasons.append("All quality signals within acceptable range")
+
+    return {
+        "action": action,
+        "agents_to_add": agents_to_add,
+        "agents_to_remove": agents_to_remove,
+        "rationale": "; ".join(reasons) if reasons else "No adjustment needed",
+    }
+
 
 class SwarmAdjuster:
     """Monitors quality signals and adjusts agent composition mid-project.
 
-    Evaluates quality signals (gate pass rates, test coverage, review
-    feedback) and recommends swarm composition changes to address
-    detected weaknesses.
+    Thin wrapper kept for backward compatibility; the logic lives in
+    the module-level evaluate_adjustment function.
     """
 
     def evaluate_adjustment(
@@ -55,108 +211,5 @@ class SwarmAdjuster:
         current_agents: List[Dict[str, Any]],
         quality_signals: Dict[str, Any],
     ) -> Dict[str, Any]:
-        """Evaluate whether the swarm needs adjustment.
-
-        Args:
-            current_agents: List of agent dicts with at least 'type' and
-                'priority' keys.
-            quality_signals: Dict with quality metrics:
-                gate_pass_rate: float (0-1) -- fraction of quality gates passing
-                test_coverage: float (0-1) -- code test coverage
-                review_pass_rate: float (0-1) -- fraction of reviews passing
-                iteration_count: int -- current RARV iteration
-                failed_gates: list[str] -- names of failing quality gates
-
-        Returns:
-            Dict with keys:
-                action: "none" | "add" | "remove" | "replace"
-                agents_to_add: list of {type, reason} dicts
-                agents_to_remove: list of {type, reason} dicts
-                rationale: human-readable explanation
-        """
-        gate_pass_rate = quality_signals.get("gate_pass_rate", 1.0)
-        test_coverage = quality_signals.get("test_coverage", 1.0)
-        review_pass_rate = quality_signals.get("review_pass_rate", 1.0)
-        iteration_count = quality_signals.get("iteration_count", 0)
-        failed_gates = quality_signals.get("failed_gates", [])
-
-        current_types = {a.get("type", "") for a in current_agents}
-        agents_to_add: List[Dict[str, str]] = []
-        agents_to_remove: List[Dict[str, str]] = []
-        reasons: List[str] = []
-
-        # Rule 1: Failing quality gates after several iterations
-        if gate_pass_rate < 0.5 and iteration_count > 3:
-            for gate_name in failed_gates:
-                agent_type = GATE_TO_AGENT.get(gate_name.lower())
-                if agent_type and agent_type not in current_types:
-                    agents_to_add.append({
-                        "type": agent_type,
-                        "reason": f"Gate '{gate_name}' failing consistently",
-                    })
-                    current_types.add(agent_type)
-            if agents_to_add:
-                reasons.append(
-                    f"Gate pass rate ({gate_pass_rate:.0%}) below 50% "
-                    f"after {iteration_count} iterations"
-                )
-
-        # Rule 2: Low test coverage
-        if test_coverage < 0.6 and "eng-qa" not in current_types:
-            agents_to_add.append({
-                "type": "eng-qa",
-                "reason": f"Test coverage at {test_coverage:.0%}, below 60% threshold",
-            })
-            current_types.add("eng-qa")
-            reasons.append(f"Test coverage ({test_coverage:.0%}) critically low")
-
-        # Rule 3: Low review pass rate
-        if review_pass_rate < 0.5 and "review-security" not in current_types:
-            agents_to_add.append({
-                "type": "review-security",
-                "reason": f"Review pass rate at {review_pass_rate:.0%}, adding security review",
-            })
-            current_types.add("review-security")
-            reasons.append(f"Review pass rate ({review_pass_rate:.0%}) below 50%")
-
-        # Rule 4: Everything healthy -- consider trimming
-        if (
-            gate_pass_rate > 0.8
-            and test_coverage > 0.8
-            and review_pass_rate > 0.8
-            and len(current_agents) > 4
-            and not agents_to_add
-        ):
-            # Find lowest-priority agent to potentially remove
-            optional_agents = [
-                a for a in current_agents
-                if a.get("priority", 1) >= 3
-            ]
-            if optional_agents:
-                # Remove the one with highest priority number (least critical)
-                to_remove = max(optional_agents, key=lambda a: a.get("priority", 1))
-                agents_to_remove.append({
-                    "type": to_remove.get("type", "unknown"),
-                    "reason": "All quality signals healthy; reducing team size",
-                })
-                reasons.append(
-                    "All signals above 80%; trimming optional agent"
-                )
-
-        # Determine action
-        if agents_to_add and agents_to_remove:
-            action = "replace"
-        elif agents_to_add:
-            action = "add"
-        elif agents_to_remove:
-            action = "remove"
-        else:
-            action = "none"
-            reasons.append("All quality signals within acceptable range")
-
-        return {
-            "action": action,
-            "agents_to_add": agents_to_add,
-            "agents_to_remove": agents_to_remove,
-            "rationale": "; ".join(reasons) if reasons else "No adjustment needed",
-        }
+        """Forward to the module-level evaluate_adjustment."""
+        return evaluate_adjustment(current_agents, quality_signals)
@@ -6,55 +6,102 @@ allowing the system to weight votes by historical reliability.
 
 import json
 import os
+import time
+
+# orjson is optional - faster snapshot parsing when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from collections import deque
 from pathlib import Path
 from datetime import datetime, timezone
 
 
 class CalibrationTracker:
-    """Tracks reviewer accuracy across review rounds."""
+    """Tracks reviewer accuracy across review rounds.
+
+    Each recorded round is appended to a JSONL journal immediately;
+    the full snapshot is rewritten only by save(), which runs
+    automatically after enough journaled rounds or elapsed time. On
+    load, any journal left by a previous run is replayed on top of
+    the snapshot, so durability does not require rewriting the whole
+    history per round.
+    """
+
+    # Rewrite the snapshot after this many journaled rounds or seconds
+    FLUSH_AFTER_ROUNDS = 50
+    FLUSH_AFTER_SECONDS = 30.0
 
     def __init__(self, calibration_file=None):
         self.calibration_file = Path(calibration_file or '.loki/council/calibration.json')
+        self.journal_file = self.calibration_file.with_suffix('.jsonl')
+        self._journal_count = 0
+        self._last_flush = time.monotonic()
         self._data = self._load()
 
     def _load(self):
+        data = {'reviewers': {}, 'rounds': deque(maxlen=100)}
         if self.calibration_file.exists():
             try:
-                with open(self.calibration_file) as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
+                raw = self.calibration_file.read_bytes()
+                loaded = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                data['reviewers'] = loaded.get('reviewers', {})
+                data['rounds'].extend(loaded.get('rounds', []))
+            except (ValueError, IOError):
+                pass
+
+        # Replay rounds journaled after the last snapshot
+        if self.journal_file.exists():
+            replayed = False
+            try:
+                with open(self.journal_file) as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            entry = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue
+                        self._apply_round_entry(data, entry)
+                        replayed = True
+            except IOError:
                 pass
-        return {'reviewers': {}, 'rounds': []}
+            if replayed:
+                # Fold the journal into a fresh snapshot
+                self._data = data
+                self.save()
+        return data
 
     def save(self):
+        """Write the full snapshot and truncate the journal."""
         self.calibration_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.calibration_file, 'w') as f:
-            json.dump(self._data, f, indent=2)
-
-    def record_round(self, iteration, votes, final_decision, ground_truth=None):
-        """Record a review round for calibration tracking.
-
-        Args:
-            iteration: RARV iteration number
-            votes: List of vote dicts with 'reviewer_id' and 'verdict'
-            final_decision: The final council decision ('approve' or 'reject')
-            ground_truth: Optional actual outcome (used to calibrate later)
-        """
-        round_entry = {
-            'iteration': iteration,
-            'timestamp': datetime.now(timezone.utc).isoformat() + 'Z',
-            'final_decision': final_decision,
-            'ground_truth': ground_truth,
-            'votes': [],
+        snapshot = {
+            'reviewers': self._data['reviewers'],
+            'rounds': list(self._data['rounds']),
         }
-
-        for vote in votes:
-            reviewer_id = vote.get('reviewer_id', 'unknown')
-            verdict = vote.get('verdict', '').lower()
-
-            # Initialize reviewer if new
-            if reviewer_id not in self._data['reviewers']:
-                self._data['reviewers'][reviewer_id] = {
+        with open(self.calibration_file, 'w') as f:
+            json.dump(snapshot, f, indent=2)
+        try:
+            if self.journal_file.exists():
+                self.journal_file.unlink()
+        except IOError:
+            pass
+        self._journal_count = 0
+        self._last_flush = time.monotonic()
+
+    @staticmethod
+    def _apply_round_entry(data, round_entry):
+        """Apply a completed round entry to reviewer stats and history."""
+        final_decision = round_entry.get('final_decision')
+        now_iso = round_entry.get('timestamp')
+
+        for vote_entry in round_entry.get('votes', []):
+            reviewer_id = vote_entry.get('reviewer_id', 'unknown')
+
+            if reviewer_id not in data['reviewers']:
+                data['reviewers'][reviewer_id] = {
                     'total_reviews': 0,
                     'agreements_with_final': 0,
                     'disagreements_with_final': 0,
@@ -62,15 +109,18 @@ class CalibrationTracker:
                     'false_positives': 0,
                     'false_negatives': 0,
                     'calibration_score': 0.5,
-                    'first_seen': datetime.now(timezone.utc).isoformat() + 'Z',
-                    'last_seen': datetime.now(timezone.utc).isoformat() + 'Z',
+                    'first_seen': now_iso,
+                    'last_seen': now_iso,
                 }
 
-            reviewer = self._data['reviewers'][reviewer_id]
+            reviewer = data['reviewers'][reviewer_id]
             reviewer['total_reviews'] += 1
-            reviewer['last_seen'] = datetime.now(timezone.utc).isoformat() + 'Z'
+            reviewer['last_seen'] = now_iso
 
-            agreed = (verdict == final_decision)
+            agreed = vote_entry.get(
+                'agreed_with_final',
+                vote_entry.get('verdict') == final_decision,
+            )
             if agreed:
                 reviewer['agreements_with_final'] += 1
             else:
@@ -83,17 +133,85 @@ class CalibrationTracker:
                 (1 - alpha) * reviewer['calibration_score'] + alpha * match_score
             )
 
-            round_entry['votes'].append({
-                'reviewer_id': reviewer_id,
-                'verdict': verdict,
-                'agreed_with_final': agreed,
-            })
+        data['rounds'].append(round_entry)
+
+    def record_round(self, iteration, votes, final_decision, ground_truth=None):
+        """Record a review round for calibration tracking.
+
+        Args:
+            iteration: RARV iteration number
+            votes: List of vote dicts with 'reviewer_id' and 'verdict'
+            final_decision: The final council decision ('approve' or 'reject')
+            ground_truth: Optional actual outcome (used to calibrate later)
+        """
+        # One timestamp for the whole round
+        now_iso = datetime.now(timezone.utc).isoformat() + 'Z'
 
-        self._data['rounds'].append(round_entry)
+        round_entry = {
+            'iteration': iteration,
+            'timestamp': now_iso,
+            'final_decision': final_decision,
+            'ground_truth': ground_truth,
+            'votes': [
+                {
+                    'reviewer_id': vote.get('reviewer_id', 'unknown'),
+                    'verdict': vote.get('verdict', '').lower(),
+                    'agreed_with_final': (
+                        vote.get('verdict', '').lower() == final_decision
+                    ),
+                }
+                for vote in votes
+            ],
+        }
 
-        # Keep only last 100 rounds
-        if len(self._data['rounds']) > 100:
-            self._data['rounds'] = self._data['rounds'][-100:]
+        self._apply_round_entry(self._data, round_entry)
+        self._journal_round(round_entry)
+
+    def _journal_round(self, round_entry):
+        """Append one round to the journal; snapshot when it grows."""
+        try:
+            self.calibration_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_file, 'a') as f:
+                f.write(json.dumps(round_entry) + '\n')
+        except IOError:
+            return
+
+        self._journal_count += 1
+        if (
+            self._journal_count >= self.FLUSH_AFTER_ROUNDS
+            or time.monotonic() - self._last_flush > self.FLUSH_AFTER_SECONDS
+        ):
+            self.save()
+
+    def record_rounds_bulk(self, round_entries):
+        """Apply many completed round entries at once (e.g. a backfill).
+
+        Each entry has the shape produced by record_round (iteration,
+        timestamp, final_decision, votes with verdict/agreed flags).
+        The whole batch is applied in one pass and journaled with a
+        single write instead of one append-and-flush-check per round.
+        """
+        if not round_entries:
+            return
+
+        for entry in round_entries:
+            self._apply_round_entry(self._data, entry)
+
+        try:
+            self.calibration_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_file, 'a') as f:
+                f.write(''.join(
+                    json.dumps(entry) + '\n' for entry in round_entries
+                ))
+        except IOError:
+            return
+
+        self._journal_count += len(round_entries)
+        if (
+            self._journal_count >= self.FLUSH_AFTER_ROUNDS
+            or time.monotonic() - self._last_flush > self.FLUSH_AFTER_SECONDS
+        ):
+            self.save()
 
     def update_ground_truth(self, iteration, ground_truth):
         """Update a round with actual outcome (e.g., did the approval lead to success?)."""
@@ -14,7 +14,15 @@ from __future__ import annotations
 
 import os
 import re
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+# pyahocorasick is optional - one automaton pass replaces ~150
+# independent substring scans per classification
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 
 # Feature detection keywords grouped by category
@@ -79,6 +87,74 @@ ENTERPRISE_KEYWORDS: List[str] = [
     "sla", "99.99", "five nines", "zero downtime",
 ]
 
+# Dedupe the vocabularies once at import so no scan path needs to
+# defend against duplicate keywords per call
+FEATURE_KEYWORDS = {
+    category: list(dict.fromkeys(keywords))
+    for category, keywords in FEATURE_KEYWORDS.items()
+}
+ENTERPRISE_KEYWORDS = list(dict.fromkeys(ENTERPRISE_KEYWORDS))
+
+
+def _build_keyword_automaton():
+    """Build one automaton over all feature and enterprise keywords.
+
+    Payloads are tuples of (category, keyword) pairs because a keyword
+    can belong to multiple categories (e.g. "multi-region" is both a
+    deployment and an enterprise signal).
+    """
+    if ahocorasick is None:
+        return None
+
+    payloads: Dict[str, List[Tuple[str, str]]] = {}
+    for category, keywords in FEATURE_KEYWORDS.items():
+        for keyword in keywords:
+            payloads.setdefault(keyword, []).append((category, keyword))
+    for keyword in ENTERPRISE_KEYWORDS:
+        payloads.setdefault(keyword, []).append(("enterprise", keyword))
+
+    automaton = ahocorasick.Automaton()
+    for keyword, entries in payloads.items():
+        automaton.add_word(keyword, tuple(entries))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _build_alternation(keywords: List[str]) -> "re.Pattern[str]":
+    """Compile an overlap-safe longest-first alternation for keywords.
+
+    The alternation is wrapped in a lookahead so the scan examines
+    every starting position instead of consuming matched text - a
+    plain finditer would swallow "service mesh" inside
+    "microservice mesh" after matching "microservice".
+    """
+    ordered = sorted(map(re.escape, keywords), key=len, reverse=True)
+    return re.compile("(?=(" + "|".join(ordered) + "))")
+
+
+# Fallback scanning when pyahocorasick is unavailable: one precompiled
+# C-level alternation scan per category instead of K substring scans.
+# The lookahead catches overlaps at different starting positions;
+# keywords nested inside a longer keyword of the same list (for
+# example "postgres" in "postgresql") share a starting position and
+# are rechecked individually afterwards, since only one alternative
+# can win per position
+_CATEGORY_REGEX = {
+    category: _build_alternation(keywords)
+    for category, keywords in FEATURE_KEYWORDS.items()
+}
+_ENTERPRISE_REGEX = _build_alternation(ENTERPRISE_KEYWORDS)
+_NESTED_KEYWORDS = {
+    category: [
+        kw for kw in keywords
+        if any(kw != other and kw in other for other in keywords)
+    ]
+    for category, keywords in FEATURE_KEYWORDS.items()
+}
+
 # Agent count recommendations per tier
 TIER_AGENT_COUNTS: Dict[str, int] = {
     "simple": 3,
@@ -88,6 +164,45 @@ TIER_AGENT_COUNTS: Dict[str, int] = {
 }
 
 
+def _scan_text(text_lower: str) -> Tuple[Dict[str, int], bool]:
+    """One pass over lowered text: feature counts plus enterprise flag."""
+    # Single automaton pass over the text when available
+    if _KEYWORD_AUTOMATON is not None:
+        matched: Dict[str, set] = {c: set() for c in FEATURE_KEYWORDS}
+        enterprise_hit = False
+        for _, entries in _KEYWORD_AUTOMATON.iter(text_lower):
+            for category, keyword in entries:
+                if category == "enterprise":
+                    enterprise_hit = True
+                else:
+                    matched[category].add(keyword)
+        return {c: len(s) for c, s in matched.items()}, enterprise_hit
+
+    features: Dict[str, int] = {}
+    for category, regex in _CATEGORY_REGEX.items():
+        matched_kws = {m.group(1) for m in regex.finditer(text_lower)}
+        for keyword in _NESTED_KEYWORDS[category]:
+            if keyword not in matched_kws and keyword in text_lower:
+                matched_kws.add(keyword)
+        features[category] = len(matched_kws)
+
+    enterprise_hit = _ENTERPRISE_REGEX.search(text_lower) is not None
+    return features, enterprise_hit
+
+
+@lru_cache(maxsize=64)
+def _scan_prd_cached(prd_text: str) -> Tuple[Tuple[Tuple[str, int], ...], bool]:
+    """Cache scans keyed on the PRD text.
+
+    The same PRD commonly flows through classification several times
+    in one session (composition, rationale, logging); repeat calls
+    skip the lowercasing and keyword scan entirely. Results are
+    hashable tuples so cached entries cannot be mutated by callers.
+    """
+    features, enterprise_hit = _scan_text(prd_text.lower())
+    return tuple(features.items()), enterprise_hit
+
+
 class PRDClassifier:
     """Classifies PRD complexity based on content analysis.
 
@@ -112,17 +227,22 @@ class PRDClassifier:
         if not prd_text:
             return {category: 0 for category in FEATURE_KEYWORDS}
 
-        text_lower = prd_text.lower()
-        features: Dict[str, int] = {}
+        return dict(_scan_prd_cached(prd_text)[0])
+
+    def _scan(self, text_lower: str) -> "Tuple[Dict[str, int], bool]":
+        """Scan lowered text once for feature counts and enterprise hits.
 
-        for category, keywords in FEATURE_KEYWORDS.items():
-            matched = set()
-            for keyword in keywords:
-                if keyword in text_lower:
-                    matched.add(keyword)
-            features[category] = len(matched)
+        Fuses the feature extraction and the enterprise-keyword check
+        into a single pass so classify() lowercases and walks the PRD
+        exactly once.
 
-        return features
+        Args:
+            text_lower: Lowercased PRD text.
+
+        Returns:
+            Tuple of (feature counts per category, enterprise flag).
+        """
+        return _scan_text(text_lower)
 
     def _total_feature_hits(self, features: Dict[str, int]) -> int:
         """Sum all feature hits across categories."""
@@ -132,14 +252,7 @@ class PRDClassifier:
         """Count how many feature categories have at least one hit."""
         return sum(1 for v in features.values() if v > 0)
 
-    def _has_enterprise_keywords(self, prd_text: str) -> bool:
-        """Check if PRD contains enterprise-specific keywords."""
-        if not prd_text:
-            return False
-        text_lower = prd_text.lower()
-        return any(kw in text_lower for kw in ENTERPRISE_KEYWORDS)
-
-    def _score_tier(self, features: Dict[str, int], prd_text: str = "") -> str:
+    def _score_tier(self, features: Dict[str, int], has_enterprise: bool = False) -> str:
         """Determine complexity tier from extracted features.
 
         Scoring rules:
@@ -150,7 +263,7 @@ class PRDClassifier:
 
         Args:
             features: Feature counts from extract_features().
-            prd_text: Original PRD text (for enterprise keyword check).
+            has_enterprise: Whether the scan saw enterprise keywords.
 
         Returns:
             One of: "simple", "standard", "complex", "enterprise"
@@ -159,7 +272,7 @@ class PRDClassifier:
         active_categories = self._count_active_categories(features)
 
         # Enterprise check: explicit keywords or very high feature count
-        if self._has_enterprise_keywords(prd_text) or total > 25:
+        if has_enterprise or total > 25:
             return "enterprise"
 
         # Complex: high feature count or many active categories
@@ -230,10 +343,18 @@ class PRDClassifier:
         Returns:
             Dict with keys: tier, confidence, features, agent_count
         """
+        # Scan the PRD (memoized on the text, so repeat
+        # classifications of the same PRD are O(1))
+        if prd_text:
+            feature_items, has_enterprise = _scan_prd_cached(prd_text)
+            features = dict(feature_items)
+        else:
+            features = {category: 0 for category in FEATURE_KEYWORDS}
+            has_enterprise = False
+
         # Check for environment variable override
         override = os.environ.get("LOKI_COMPLEXITY", "").lower().strip()
         if override in self.TIERS:
-            features = self.extract_features(prd_text)
             return {
                 "tier": override,
                 "confidence": 1.0,
@@ -242,8 +363,7 @@ class PRDClassifier:
                 "override": True,
             }
 
-        features = self.extract_features(prd_text)
-        tier = self._score_tier(features, prd_text)
+        tier = self._score_tier(features, has_enterprise)
         return {
             "tier": tier,
             "confidence": self._compute_confidence(features),
@@ -12,6 +12,13 @@ from typing import Any, Dict, List, Optional
 from .registry import AGENT_TYPES, AGENT_CAPABILITIES, SWARM_CATEGORIES
 from .classifier import TIER_AGENT_COUNTS
 
+# pyahocorasick is optional - single-pass technology scanning over org
+# pattern text (same soft dependency as the classifier's keyword scan)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 
 # Base team: always included regardless of tier
 BASE_TEAM = [
@@ -54,6 +61,59 @@ FEATURE_AGENT_MAP: Dict[str, Dict[str, Any]] = {
     },
 }
 
+# Technology -> agent type mapping used when scanning org patterns.
+# This is the canonical routing vocabulary; the classifier's feature
+# keyword lists intentionally remain a superset tuned for scoring
+TECH_TO_AGENT: Dict[str, str] = {
+    "react": "eng-frontend",
+    "vue": "eng-frontend",
+    "svelte": "eng-frontend",
+    "angular": "eng-frontend",
+    "next.js": "eng-frontend",
+    "nuxt": "eng-frontend",
+    "postgresql": "eng-database",
+    "mongodb": "eng-database",
+    "redis": "eng-database",
+    "mysql": "eng-database",
+    "docker": "ops-devops",
+    "kubernetes": "ops-devops",
+    "terraform": "ops-devops",
+    "playwright": "eng-qa",
+    "cypress": "eng-qa",
+    "jest": "eng-qa",
+    "stripe": "eng-api",
+    "graphql": "eng-api",
+    "rest api": "eng-api",
+    "react-native": "eng-mobile",
+    "flutter": "eng-mobile",
+    "swift": "eng-mobile",
+    "kotlin": "eng-mobile",
+    "ml": "data-ml",
+    "machine learning": "data-ml",
+    "analytics": "data-analytics",
+}
+
+
+def _build_tech_automaton():
+    """Build an automaton over the technology vocabulary, if available."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for tech in TECH_TO_AGENT:
+        automaton.add_word(tech, tech)
+    automaton.make_automaton()
+    return automaton
+
+
+_TECH_AUTOMATON = _build_tech_automaton()
+
+# Reverse index: agent type -> swarm category (role)
+_AGENT_TYPE_TO_ROLE: Dict[str, str] = {
+    agent_type: category
+    for category, types in SWARM_CATEGORIES.items()
+    for agent_type in types
+}
+
 # Enterprise-tier additional agents
 ENTERPRISE_AGENTS = [
     {"type": "ops-sre", "role": "operations", "priority": 3},
@@ -160,36 +220,6 @@ class SwarmComposer:
         """
         added = False
 
-        # Technology -> agent type mapping
-        tech_to_agent = {
-            "react": "eng-frontend",
-            "vue": "eng-frontend",
-            "svelte": "eng-frontend",
-            "angular": "eng-frontend",
-            "next.js": "eng-frontend",
-            "nuxt": "eng-frontend",
-            "postgresql": "eng-database",
-            "mongodb": "eng-database",
-            "redis": "eng-database",
-            "mysql": "eng-database",
-            "docker": "ops-devops",
-            "kubernetes": "ops-devops",
-            "terraform": "ops-devops",
-            "playwright": "eng-qa",
-            "cypress": "eng-qa",
-            "jest": "eng-qa",
-            "stripe": "eng-api",
-            "graphql": "eng-api",
-            "rest api": "eng-api",
-            "react-native": "eng-mobile",
-            "flutter": "eng-mobile",
-            "swift": "eng-mobile",
-            "kotlin": "eng-mobile",
-            "ml": "data-ml",
-            "machine learning": "data-ml",
-            "analytics": "data-analytics",
-        }
-
         # Search through org patterns for technology mentions
         for pattern in org_patterns:
             pattern_text = " ".join([
@@ -199,15 +229,17 @@ class SwarmComposer:
                 str(pattern.get("category", "")),
             ]).lower()
 
-            for tech, agent_type in tech_to_agent.items():
-                if tech in pattern_text and agent_type not in agent_types_added:
-                    # Determine role from swarm categories
-                    role = "engineering"
-                    for cat, types in SWARM_CATEGORIES.items():
-                        if agent_type in types:
-                            role = cat
-                            break
-
+            # One pass over the pattern text collects every mentioned
+            # technology; iteration below stays in vocabulary order so
+            # team composition is unchanged
+            if _TECH_AUTOMATON is not None:
+                mentioned = {tech for _, tech in _TECH_AUTOMATON.iter(pattern_text)}
+            else:
+                mentioned = {tech for tech in TECH_TO_AGENT if tech in pattern_text}
+
+            for tech, agent_type in TECH_TO_AGENT.items():
+                if tech in mentioned and agent_type not in agent_types_added:
+                    role = _AGENT_TYPE_TO_ROLE.get(agent_type, "engineering")
                     agents.append({
                         "type": agent_type,
                         "role": role,
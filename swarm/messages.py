@@ -18,6 +18,20 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+# orjson is optional - accelerates canonical serialization for message
+# authentication
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _canonical_json(obj: Any) -> bytes:
+    """Serialize a value to canonical (sorted-key) JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True).encode()
+
 
 class MessageType(str, Enum):
     """Types of swarm messages."""
@@ -446,6 +460,22 @@ class SwarmMessage:
         """Check if this is a broadcast message."""
         return self.recipient_id is None
 
+    def canonical_bytes(self, refresh: bool = False) -> bytes:
+        """
+        Canonical (sorted-key) JSON bytes of this message, cached.
+
+        Messages are effectively immutable once constructed, so the
+        first serialization is reused when the same message crosses
+        the authentication boundary more than once. Pass refresh=True
+        where immutability cannot be trusted (verifying a received
+        message) to re-serialize from the current contents.
+        """
+        cached = getattr(self, "_canonical", None)
+        if cached is None or refresh:
+            cached = _canonical_json(self.to_dict())
+            self._canonical = cached
+        return cached
+
 
 class MessageBus:
     """
@@ -11,6 +11,14 @@ from __future__ import annotations
 import json
 import os
 import tempfile
+from collections import deque
+from functools import lru_cache
+
+# orjson is optional - C-level (de)serialization for the storage file
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -22,6 +30,29 @@ DEFAULT_STORAGE_PATH = ".loki/memory/agent-performance.json"
 MAX_RECENT_SCORES = 20
 
 
+@lru_cache(maxsize=64)
+def _iso_second_prefix(year: int, month: int, day: int,
+                       hour: int, minute: int, second: int) -> str:
+    """Cache the to-the-second part of a UTC timestamp string."""
+    return f"{year:04d}-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}:{second:02d}"
+
+
+def _utc_now_iso() -> str:
+    """UTC timestamp matching isoformat().replace("+00:00", "Z").
+
+    Builds the string from a cached per-second prefix instead of
+    formatting every field and scanning the result with str.replace
+    on each recorded task.
+    """
+    now = datetime.now(timezone.utc)
+    prefix = _iso_second_prefix(
+        now.year, now.month, now.day, now.hour, now.minute, now.second
+    )
+    if now.microsecond:
+        return f"{prefix}.{now.microsecond:06d}Z"
+    return prefix + "Z"
+
+
 class AgentPerformanceTracker:
     """Tracks per-agent-type performance across runs.
 
@@ -40,6 +71,8 @@ class AgentPerformanceTracker:
         self.storage_path = Path(storage_path or DEFAULT_STORAGE_PATH)
         self._data: Dict[str, Dict[str, Any]] = {}
         self.load()
+        # Save only when something actually changed
+        self._dirty = False
 
     def record_task_completion(
         self,
@@ -56,36 +89,45 @@ class AgentPerformanceTracker:
             quality_score: Quality score between 0.0 and 1.0.
             duration_seconds: Task duration in seconds.
         """
-        quality_score = max(0.0, min(1.0, quality_score))
-        duration_seconds = max(0.0, duration_seconds)
+        # Explicit conditional clamps avoid two builtin calls per record
+        if quality_score < 0.0:
+            quality_score = 0.0
+        elif quality_score > 1.0:
+            quality_score = 1.0
+        if duration_seconds < 0.0:
+            duration_seconds = 0.0
 
         if agent_type not in self._data:
             self._data[agent_type] = {
                 "total_tasks": 0,
+                "sum_quality": 0,
+                "sum_duration": 0,
                 "avg_quality": 0.0,
                 "avg_duration": 0.0,
-                "recent_scores": [],
+                "recent_scores": deque(maxlen=MAX_RECENT_SCORES),
                 "last_updated": "",
             }
 
         entry = self._data[agent_type]
         n = entry["total_tasks"]
 
-        # Update running averages
-        entry["avg_quality"] = (entry["avg_quality"] * n + quality_score) / (n + 1)
-        entry["avg_duration"] = (entry["avg_duration"] * n + duration_seconds) / (n + 1)
+        # Accumulate fixed-point integers (quality in 1/10000ths,
+        # duration in centiseconds); the averages are derived from the
+        # exact sums each time, so repeated updates cannot accumulate
+        # rounding drift the way the old rounded running average did
+        entry["sum_quality"] = entry.get("sum_quality", 0) + int(round(quality_score * 10000))
+        entry["sum_duration"] = entry.get("sum_duration", 0) + int(round(duration_seconds * 100))
         entry["total_tasks"] = n + 1
 
-        # Round for cleaner storage
-        entry["avg_quality"] = round(entry["avg_quality"], 4)
-        entry["avg_duration"] = round(entry["avg_duration"], 2)
+        entry["avg_quality"] = round(entry["sum_quality"] / (10000 * (n + 1)), 4)
+        entry["avg_duration"] = round(entry["sum_duration"] / (100 * (n + 1)), 2)
 
-        # Maintain recent scores window
+        # Maintain recent scores window; the deque's maxlen drops the
+        # oldest entry automatically with no per-call slice copy
         entry["recent_scores"].append(round(quality_score, 4))
-        if len(entry["recent_scores"]) > MAX_RECENT_SCORES:
-            entry["recent_scores"] = entry["recent_scores"][-MAX_RECENT_SCORES:]
 
-        entry["last_updated"] = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        entry["last_updated"] = _utc_now_iso()
+        self._dirty = True
 
     def get_performance_scores(self) -> Dict[str, Dict[str, Any]]:
         """Get performance scores for all tracked agent types.
@@ -150,34 +192,56 @@ class AgentPerformanceTracker:
         Returns:
             Trend value roughly in [-1.0, 1.0].
         """
-        if len(recent_scores) < 2:
+        count = len(recent_scores)
+        if count < 2:
             return 0.0
 
-        # Compare recent half to older half
-        mid = len(recent_scores) // 2
-        older = recent_scores[:mid]
-        newer = recent_scores[mid:]
-
-        if not older or not newer:
-            return 0.0
+        # Compare recent half to older half in a single pass (works on
+        # lists and deques alike): sum everything once and derive the
+        # newer half as total minus the older half
+        mid = count // 2
+        total = 0.0
+        older_sum = 0.0
+        for i, score in enumerate(recent_scores):
+            total += score
+            if i < mid:
+                older_sum += score
 
-        older_avg = sum(older) / len(older)
-        newer_avg = sum(newer) / len(newer)
+        older_avg = older_sum / mid
+        newer_avg = (total - older_sum) / (count - mid)
 
         # Difference clamped to [-1, 1]
         diff = newer_avg - older_avg
         return max(-1.0, min(1.0, round(diff, 4)))
 
     def save(self) -> None:
-        """Persist performance data to disk (atomic write)."""
+        """Persist performance data to disk (atomic write).
+
+        No-op when nothing changed since the last save, so callers
+        that save after every recorded task do not pay a full
+        re-serialization for data that is already on disk.
+        """
+        if not self._dirty:
+            return
+
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
         fd, tmp_path = tempfile.mkstemp(
             dir=str(self.storage_path.parent), suffix=".tmp"
         )
         try:
-            with os.fdopen(fd, "w") as f:
-                json.dump(self._data, f, indent=2)
+            # Serialize the in-memory deques as plain lists
+            serializable = {
+                agent_type: {**entry, "recent_scores": list(entry["recent_scores"])}
+                for agent_type, entry in self._data.items()
+            }
+            if orjson is not None:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(orjson.dumps(serializable, option=orjson.OPT_INDENT_2))
+            else:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(serializable, f, indent=2)
             os.replace(tmp_path, str(self.storage_path))
+            self._dirty = False
         except BaseException:
             # Clean up temp file on failure
             try:
@@ -190,16 +254,37 @@ class AgentPerformanceTracker:
         """Load performance data from disk."""
         if self.storage_path.exists():
             try:
-                with open(self.storage_path, "r") as f:
-                    self._data = json.load(f)
-            except (json.JSONDecodeError, IOError):
+                raw = self.storage_path.read_bytes()
+                self._data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            except (ValueError, IOError):
                 self._data = {}
         else:
             self._data = {}
 
+        # Wrap score histories in bounded deques, and migrate entries
+        # written before the integer accumulators by back-filling the
+        # sums from the stored averages
+        for entry in self._data.values():
+            entry["recent_scores"] = deque(
+                entry.get("recent_scores", []), maxlen=MAX_RECENT_SCORES
+            )
+            if "sum_quality" not in entry:
+                total = entry.get("total_tasks", 0)
+                entry["sum_quality"] = int(round(
+                    entry.get("avg_quality", 0.0) * total * 10000
+                ))
+                entry["sum_duration"] = int(round(
+                    entry.get("avg_duration", 0.0) * total * 100
+                ))
+
+    def flush(self) -> None:
+        """Alias for save()."""
+        self.save()
+
     def clear(self) -> None:
         """Clear all performance data."""
         self._data = {}
+        self._dirty = True
 
     def get_agent_data(self, agent_type: str) -> Optional[Dict[str, Any]]:
         """Get raw performance data for a specific agent type.
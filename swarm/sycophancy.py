@@ -4,9 +4,15 @@ Detects when reviewers are rubber-stamping rather than independently evaluating.
 Scores range from 0.0 (fully independent) to 1.0 (likely sycophantic).
 """
 
+import itertools
 import json
 import re
-from collections import Counter
+from collections import Counter, defaultdict
+
+# Precompiled at import: skips re's per-call cache lookup, and the
+# ASCII class is markedly faster than Unicode \w on the English
+# reasoning text reviewers produce
+_WORD_RE = re.compile(r'[A-Za-z0-9_]+')
 
 
 def detect_sycophancy(votes):
@@ -30,16 +36,32 @@ def detect_sycophancy(votes):
     unanimity_score = most_common_count / len(verdicts)
     signals.append(unanimity_score * 0.3)  # Weight: 30%
 
-    # Signal 2: Reasoning text similarity (Jaccard on word sets)
-    reasonings = [set(re.findall(r'\w+', v.get('reasoning', '').lower())) for v in votes]
+    # Signal 2: Reasoning text similarity (Jaccard on word sets).
+    # Pairwise intersections come from a word -> votes inverted index
+    # built in one pass over all tokens, instead of materializing a
+    # set intersection and union per reviewer pair
+    reasonings = [set(_WORD_RE.findall(v.get('reasoning', '').lower())) for v in votes]
     if all(len(r) > 0 for r in reasonings):
+        n_votes = len(reasonings)
+        word_to_votes = defaultdict(list)
+        for i, words in enumerate(reasonings):
+            for word in words:
+                word_to_votes[word].append(i)
+
+        intersections = [[0] * n_votes for _ in range(n_votes)]
+        for vote_ids in word_to_votes.values():
+            if len(vote_ids) > 1:
+                for a, b in itertools.combinations(vote_ids, 2):
+                    intersections[a][b] += 1
+
         similarity_scores = []
-        for i in range(len(reasonings)):
-            for j in range(i + 1, len(reasonings)):
-                intersection = len(reasonings[i] & reasonings[j])
-                union = len(reasonings[i] | reasonings[j])
+        for i in range(n_votes):
+            size_i = len(reasonings[i])
+            row = intersections[i]
+            for j in range(i + 1, n_votes):
+                union = size_i + len(reasonings[j]) - row[j]
                 if union > 0:
-                    similarity_scores.append(intersection / union)
+                    similarity_scores.append(row[j] / union)
         avg_similarity = sum(similarity_scores) / len(similarity_scores) if similarity_scores else 0
         signals.append(avg_similarity * 0.3)  # Weight: 30%
     else:
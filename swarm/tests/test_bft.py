@@ -612,6 +612,44 @@ class TestPersistence:
         assert len(rep.faults) == 1
         assert rep.faults[0].id == "fault-1"
 
+    def test_wal_replay_and_compaction(self, registry, temp_loki_dir):
+        """Updates land in the WAL and fold into the snapshot on restart."""
+        bft1 = ByzantineFaultTolerance(registry, temp_loki_dir)
+
+        agent = registry.register("eng-backend")
+        for _ in range(5):
+            bft1.update_reputation(agent.id, success=True)
+        fault = FaultRecord(
+            id="fault-wal-1",
+            agent_id=agent.id,
+            fault_type=FaultType.TIMEOUT,
+            severity=0.3,
+            description="Test",
+        )
+        bft1.update_reputation(agent.id, success=False, fault=fault)
+
+        wal_file = temp_loki_dir / "swarm" / "bft" / "reputations.wal"
+        assert wal_file.exists()
+        assert len(wal_file.read_bytes().splitlines()) == 6
+
+        # A new instance replays the WAL and folds it into the snapshot
+        bft2 = ByzantineFaultTolerance(registry, temp_loki_dir)
+        rep = bft2.get_reputation(agent.id)
+        assert rep.total_interactions == 6
+        assert rep.successful_interactions == 5
+        assert len(rep.faults) == 1
+        assert rep.score == bft1.get_reputation(agent.id).score
+        assert not wal_file.exists()
+
+        stats = bft2.get_stats()
+        assert stats["total_interactions"] == 6
+        assert stats["total_faults_recorded"] == 1
+        assert stats["fault_types"] == {"timeout": 1}
+
+        # Replay is not applied twice on a further restart
+        bft3 = ByzantineFaultTolerance(registry, temp_loki_dir)
+        assert bft3.get_reputation(agent.id).total_interactions == 6
+
     def test_save_and_load_config(self, registry, temp_loki_dir):
         """Test configuration persistence."""
         config = BFTConfig(
@@ -838,6 +876,44 @@ class TestConsensusRound:
         round_obj.commit_votes = {"a": "h", "b": "h", "c": "h", "d": "h", "e": "h"}
         assert round_obj.has_commit_quorum(7) is True
 
+    def test_split_votes_do_not_reach_quorum(self):
+        """2f+1 votes split across different values must NOT be a quorum."""
+        round_obj = ConsensusRound(
+            id="round-1",
+            proposal_id="prop-1",
+        )
+
+        # For 4 agents, 3 votes would reach quorum if they agreed --
+        # but these endorse three different values
+        round_obj.add_prepare_vote("a", "h1")
+        round_obj.add_prepare_vote("b", "h2")
+        round_obj.add_prepare_vote("c", "h3")
+        assert round_obj.has_prepare_quorum(4) is False
+
+        # A fourth vote aligning with h1 still leaves only 2 matching
+        round_obj.add_prepare_vote("d", "h1")
+        assert round_obj.has_prepare_quorum(4) is False
+
+        # A vote change onto h1 makes 3 matching votes: quorum
+        round_obj.add_prepare_vote("b", "h1")
+        assert round_obj.has_prepare_quorum(4) is True
+
+    def test_split_votes_rebuild_from_direct_assignment(self):
+        """Direct dict assignment rebuilds the per-value tallies."""
+        round_obj = ConsensusRound(
+            id="round-1",
+            proposal_id="prop-1",
+        )
+
+        round_obj.prepare_votes = {"a": "h1", "b": "h2", "c": "h3"}
+        assert round_obj.has_prepare_quorum(4) is False
+
+        round_obj.commit_votes = {"a": "h1", "b": "h1", "c": "h1", "d": "h2", "e": "h3"}
+        assert round_obj.has_commit_quorum(7) is False
+
+        round_obj.commit_votes = {"a": "h1", "b": "h1", "c": "h1", "d": "h1", "e": "h1"}
+        assert round_obj.has_commit_quorum(7) is True
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -4,6 +4,7 @@ import json
 import os
 import tempfile
 import unittest
+from collections import deque
 import sys
 
 # Add parent directory to path for imports
@@ -19,7 +20,7 @@ class TestCalibrationTrackerInit(unittest.TestCase):
         with tempfile.TemporaryDirectory() as tmpdir:
             cal_file = os.path.join(tmpdir, 'cal.json')
             tracker = CalibrationTracker(cal_file)
-            self.assertEqual(tracker._data, {'reviewers': {}, 'rounds': []})
+            self.assertEqual(tracker._data, {'reviewers': {}, 'rounds': deque(maxlen=100)})
 
     def test_init_loads_existing_file(self):
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -39,7 +40,7 @@ class TestCalibrationTrackerInit(unittest.TestCase):
             with open(cal_file, 'w') as f:
                 f.write('not json')
             tracker = CalibrationTracker(cal_file)
-            self.assertEqual(tracker._data, {'reviewers': {}, 'rounds': []})
+            self.assertEqual(tracker._data, {'reviewers': {}, 'rounds': deque(maxlen=100)})
 
 
 class TestRecordRound(unittest.TestCase):